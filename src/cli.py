@@ -1,20 +1,41 @@
 import typer
 import logging
 import json
+import shutil
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
-from src.core.config import Config
-from src.core.git_operations import GitOperations
-from src.core.quadlet_handler import QuadletHandler
-from src.core.systemd_manager import SystemdManager
-from src.core.app_manager import ApplicationManager
-from src.state.manager import StateManager
-from src.core.logging import setup_logging, get_logger
-from src.main import main as service_main, get_default_paths, ensure_directories
+try:
+    import orjson
+except ImportError:  # optional, stdlib json is used instead
+    orjson = None
+
+# Only lightweight modules are imported here; the service components (Git,
+# systemd, state database, FastAPI) are imported when a command needs them
+from src.paths import get_default_paths, ensure_directories
 
 # Get logger for CLI
-logger = get_logger("src.cli")
+logger = logging.getLogger("src.cli")
+
+# Default --config value shared by all commands, resolved once at import
+DEFAULT_CONFIG_FILE = str(get_default_paths()['config_file'])
+
+# Components built by initialize_components, keyed by (resolved config file,
+# read_only) and stored with the signature of the config files they were built from
+_COMPONENTS: Dict[Tuple[Path, bool], Tuple[tuple, Any, Any]] = {}
+
+# Buffer size used when streaming files to stdout
+STREAM_CHUNK_SIZE = 64 * 1024
+
+def _check_config_file(config: Path) -> Path:
+    """Reject a missing --config file with a usage error (exit code 2).
+
+    Option callbacks run after --help has been handled, so help never
+    depends on the configuration file.
+    """
+    if not config.exists():
+        raise typer.BadParameter(f"Configuration file not found: {config}")
+    return config
 
 # Create Typer app
 app = typer.Typer(help="Podman GitOps CLI tool")
@@ -23,44 +44,90 @@ app.add_typer(app_cmd, name="app")
 config_cmd = typer.Typer(help="Manage configuration")
 app.add_typer(config_cmd, name="config")
 
-def initialize_components(config_file: Path):
+def to_json(data: Any, indent: bool = True) -> str:
+    """Serialize command output as indented JSON.
+
+    Status data from the state database contains datetimes, which are written
+    as ISO 8601 strings. Uses orjson when it is installed.
+
+    Args:
+        data: Data to serialize
+        indent: Indent output by two spaces; disable for one-line records
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_json_default, option=option).decode()
+    return json.dumps(data, indent=2 if indent else None, default=_json_default)
+
+def _json_default(value: Any) -> Any:
+    """Convert values the json module cannot serialize natively."""
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+def initialize_components(config_file: Path, read_only: bool = False):
     """Initialize all components based on configuration.
 
+    Components are reused by later calls in the same process (tests, scripts
+    invoking several commands) until the configuration files change.
+
     Args:
         config_file: Path to the configuration file
+        read_only: Skip Git setup and open the state database read-only for
+            commands that only report state
 
     Returns:
         Tuple of (config, app_manager)
     """
+    from src.core.app_manager import ApplicationManager
+    from src.core.config import Config, config_signature
+    from src.core.git_operations import GitOperations
+    from src.core.logging import setup_logging
+    from src.core.quadlet_handler import QuadletHandler
+    from src.core.systemd_manager import SystemdManager
+    from src.state.manager import StateManager
+
     # Get user paths
     paths = get_default_paths()
 
+    if not config_file.exists():
+        raise typer.BadParameter(f"Configuration file not found: {config_file}")
+
+    # Reuse components built earlier in this process for the same configuration
+    key = (config_file.resolve(), read_only)
+    signature = config_signature(key[0], paths['config_dir'])
+    cached = _COMPONENTS.get(key)
+    if cached and cached[0] == signature:
+        cached[2].state_manager.activate()
+        return cached[1], cached[2]
+
     # Ensure all directories exist
     ensure_directories(paths)
 
-    # Set up logging
-    setup_logging(paths['log_dir'], "INFO")
+    # Set up logging; commands that only report state do not write log files
+    setup_logging(paths['log_dir'], "INFO", log_to_file=not read_only)
 
     # Load configuration
-    if not config_file.exists():
-        raise typer.BadParameter(f"Configuration file not found: {config_file}")
-
-    config = Config.from_file(config_file)
-    config.load_app_configs(paths['config_dir'])
-    config.expand_paths()
+    config = Config.load(config_file, paths['config_dir'], paths['config_cache'])
 
     # Initialize components
-    state_manager = StateManager(paths['state_db'])
+    state_manager = StateManager(paths['state_db'], readonly=read_only)
     systemd_manager = SystemdManager(config.podman.quadlet_dir)
     quadlet_handler = QuadletHandler(
         systemd_dir=config.podman.quadlet_dir,
         processed_dir=paths['processed_dir'],
-        systemd_manager=systemd_manager
+        systemd_manager=systemd_manager,
+        state_manager=state_manager
     )
 
-    # Initialize Git operations if configured
+    # Initialize Git operations if configured (this may start ssh-agent)
     git_ops = None
-    if config.git:
+    if config.git and not read_only:
         git_ops = GitOperations(config.git, paths['repo_dir'])
 
     # Initialize application manager
@@ -72,16 +139,18 @@ def initialize_components(config_file: Path):
         git_ops=git_ops
     )
 
+    _COMPONENTS[key] = (signature, config, app_manager)
     return config, app_manager
 
 # Main service commands
 @app.command()
 def start(
     config: Optional[Path] = typer.Option(
-        str(get_default_paths()['config_file']),
+        DEFAULT_CONFIG_FILE,
         "--config", "-c",
         help="Path to config.toml file",
-        exists=True
+        dir_okay=False,
+        callback=_check_config_file
     ),
     no_api: bool = typer.Option(
         False,
@@ -89,6 +158,8 @@ def start(
     )
 ):
     """Start the GitOps service."""
+    from src.main import main as service_main
+
     try:
         # Call the main function directly with parameters
         exit_code = service_main(config_path=config, no_api=no_api)
@@ -101,30 +172,44 @@ def start(
 @app_cmd.command("list")
 def list_apps(
     config: Optional[Path] = typer.Option(
-        str(get_default_paths()['config_file']),
+        DEFAULT_CONFIG_FILE,
         "--config", "-c",
         help="Path to config.toml file",
-        exists=True
+        dir_okay=False,
+        callback=_check_config_file
     ),
     json_output: bool = typer.Option(
         False,
         "--json", "-j",
         help="Output in JSON format"
+    ),
+    ndjson_output: bool = typer.Option(
+        False,
+        "--ndjson",
+        help="Output one JSON object per application and line"
     )
 ):
     """List all configured applications."""
     try:
         # Initialize components
-        config_path = Path(config)
-        config_obj, app_manager = initialize_components(config_path)
+        config_obj, app_manager = initialize_components(config, read_only=True)
 
-        # Get application status
-        app_status = app_manager.get_status_all_applications()
-
-        if json_output:
-            # Print JSON output
-            typer.echo(json.dumps(app_status, indent=2))
+        if ndjson_output:
+            # Write each application as soon as it is serialized
+            app_status = app_manager.get_status_all_applications()
+            for app_name, status in app_status.items():
+                typer.echo(to_json({app_name: status}, indent=False))
+        elif json_output:
+            # Print JSON output with the full status of every service
+            app_status = app_manager.get_status_all_applications()
+            typer.echo(to_json(app_status))
         else:
+            # The formatted output only shows aggregate fields
+            app_status = app_manager.get_summaries_all_applications()
+
+            # Every application's description is shown, so parse all their configs up front
+            config_obj.app_configs.prefetch_all()
+
             # Print formatted output
             typer.echo("\nConfigured Applications:")
             typer.echo("=" * 80)
@@ -168,10 +253,11 @@ def list_apps(
 def app_status(
     app_name: str = typer.Argument(..., help="Name of the application"),
     config: Optional[Path] = typer.Option(
-        str(get_default_paths()['config_file']),
+        DEFAULT_CONFIG_FILE,
         "--config", "-c",
         help="Path to config.toml file",
-        exists=True
+        dir_okay=False,
+        callback=_check_config_file
     ),
     json_output: bool = typer.Option(
         False,
@@ -182,11 +268,10 @@ def app_status(
     """Get detailed status of an application."""
     try:
         # Initialize components
-        config_path = Path(config)
-        config_obj, app_manager = initialize_components(config_path)
+        config_obj, app_manager = initialize_components(config, read_only=True)
 
         # Check if application exists
-        if app_name not in config_obj.applications.enabled:
+        if app_name not in config_obj.applications.enabled_set:
             typer.echo(f"Application '{app_name}' is not enabled in configuration")
             return
 
@@ -195,7 +280,7 @@ def app_status(
 
         if json_output:
             # Print JSON output
-            typer.echo(json.dumps(status, indent=2))
+            typer.echo(to_json(status))
         else:
             # Print formatted output
             typer.echo(f"\nApplication: {app_name}")
@@ -236,8 +321,180 @@ def app_status(
         logger.error(f"Failed to get application status: {e}")
         raise typer.Exit(code=1)
 
-# Additional commands omitted for brevity but would follow the same pattern
-# This includes: start_app, stop_app, restart_app, deploy_app, status, list_services, restart, show_config
+@app.command()
+def status(
+    service_name: str = typer.Argument(..., help="Name of the service"),
+    app_name: Optional[str] = typer.Option(
+        None,
+        "--app", "-a",
+        help="Application the service belongs to"
+    ),
+    config: Optional[Path] = typer.Option(
+        DEFAULT_CONFIG_FILE,
+        "--config", "-c",
+        help="Path to config.toml file",
+        dir_okay=False,
+        callback=_check_config_file
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json", "-j",
+        help="Output in JSON format"
+    )
+):
+    """Get the status of a single service."""
+    try:
+        # Initialize components
+        config_obj, app_manager = initialize_components(config, read_only=True)
+
+        # Resolves the owning application from the state database if --app is not given
+        status = app_manager.get_service_status(service_name, app_name)
+
+        if status.get('status') in ('not_found', 'error'):
+            typer.echo(status.get('error'))
+            return
+
+        if json_output:
+            # Print JSON output
+            typer.echo(to_json(status))
+        else:
+            # Print formatted output
+            typer.echo(f"\nService: {service_name}")
+            typer.echo("=" * 80)
+            typer.echo(f"Application: {status['app_name']}")
+            typer.echo(f"State: {status.get('state') or 'unknown'}")
+
+            systemd_status = status.get('systemd', {})
+            typer.echo(f"Active: {systemd_status.get('active', 'unknown')}")
+
+    except Exception as e:
+        logger.error(f"Failed to get service status: {e}")
+        raise typer.Exit(code=1)
+
+@app.command()
+def list_services(
+    app_name: Optional[str] = typer.Option(
+        None,
+        "--app", "-a",
+        help="Only list services of this application"
+    ),
+    config: Optional[Path] = typer.Option(
+        DEFAULT_CONFIG_FILE,
+        "--config", "-c",
+        help="Path to config.toml file",
+        dir_okay=False,
+        callback=_check_config_file
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json", "-j",
+        help="Output in JSON format"
+    )
+):
+    """List services and their states."""
+    try:
+        # Initialize components
+        config_obj, app_manager = initialize_components(config, read_only=True)
+
+        # Only the requested application is queried when --app is given
+        app_names = [app_name] if app_name else config_obj.applications.enabled
+
+        services = {}
+        for name in app_names:
+            try:
+                services[name] = app_manager.state_manager.get_app_services(name)
+            except Exception as e:
+                # One broken application should not hide the others
+                logger.error(f"Failed to list services for application {name}: {e}")
+
+        if json_output:
+            # Print JSON output
+            typer.echo(to_json(services))
+        else:
+            # Print formatted output
+            for name, app_services in services.items():
+                typer.echo(f"\n{name}:")
+                if not app_services:
+                    typer.echo("  (no services)")
+                for service_name, state in app_services.items():
+                    typer.echo(f"  {service_name}: {state}")
+
+    except Exception as e:
+        logger.error(f"Failed to list services: {e}")
+        raise typer.Exit(code=1)
+
+def _make_app_action(verb: str, present: str, past: str, method: str):
+    """Build a command that runs one ApplicationManager action on an application.
+
+    Args:
+        verb: Command verb used in failure messages, e.g. "start"
+        present: Progress message prefix, e.g. "Starting"
+        past: Outcome shown on success, e.g. "started"
+        method: Name of the ApplicationManager method to call
+
+    Returns:
+        Command callback
+    """
+    def command(
+        app_name: str = typer.Argument(..., help="Name of the application"),
+        config: Optional[Path] = typer.Option(
+            DEFAULT_CONFIG_FILE,
+            "--config", "-c",
+            help="Path to config.toml file",
+            dir_okay=False,
+            callback=_check_config_file
+        )
+    ):
+        try:
+            # Initialize components
+            config_obj, app_manager = initialize_components(config)
+
+            # Check if application exists
+            if app_name not in config_obj.applications.enabled_set:
+                typer.echo(f"Application '{app_name}' is not enabled in configuration")
+                raise typer.Exit(code=1)
+
+            typer.echo(f"{present} application: {app_name}")
+            if not getattr(app_manager, method)(app_name):
+                typer.echo(f"Failed to {verb} application {app_name}")
+                raise typer.Exit(code=1)
+
+            typer.echo(f"Application {app_name} {past} successfully")
+
+        except typer.Exit:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to {verb} application {app_name}: {e}")
+            raise typer.Exit(code=1)
+
+    command.__doc__ = f"{verb.capitalize()} an application."
+    return command
+
+app_cmd.command("start")(_make_app_action("start", "Starting", "started", "start_application"))
+app_cmd.command("stop")(_make_app_action("stop", "Stopping", "stopped", "stop_application"))
+app_cmd.command("restart")(_make_app_action("restart", "Restarting", "restarted", "restart_application"))
+app_cmd.command("deploy")(_make_app_action("deploy", "Deploying", "deployed", "process_application"))
+
+# Configuration commands
+@config_cmd.command("show")
+def show_config(
+    config: Optional[Path] = typer.Option(
+        DEFAULT_CONFIG_FILE,
+        "--config", "-c",
+        help="Path to config.toml file",
+        dir_okay=False,
+        callback=_check_config_file
+    )
+):
+    """Show the contents of the configuration file."""
+    try:
+        # Stream the raw bytes instead of decoding the whole file into memory
+        with open(config, 'rb') as f:
+            shutil.copyfileobj(f, typer.get_binary_stream('stdout'), STREAM_CHUNK_SIZE)
+
+    except Exception as e:
+        logger.error(f"Failed to show configuration: {e}")
+        raise typer.Exit(code=1)
 
 if __name__ == "__main__":
     app()
\ No newline at end of file
@@ -1,9 +1,11 @@
 # src/core/app_manager.py - Update imports and class
+import hashlib
 import logging
 import os
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set, Any
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Set
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from .config import Config, ApplicationConfig
 from .quadlet_handler import QuadletHandler
@@ -15,6 +17,49 @@ from ..state.manager import StateManager
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of applications deployed at the same time
+MAX_PARALLEL_APPS = 8
+# Maximum number of services of one application health-checked at the same time
+MAX_PARALLEL_SERVICES = 16
+# Seconds a restart waits for services to shut down before starting them again
+RESTART_STOP_TIMEOUT = 30
+# Trailing lines and bytes of an unhealthy container's logs included in the deployment log
+LOG_EXCERPT_LINES = 40
+LOG_EXCERPT_BYTES = 500
+
+def _deployment_fingerprint(quadlet_dir: Path, env: Optional[Dict[str, str]], commit_hash: str) -> str:
+    """Fingerprint the inputs of a deployment.
+
+    Covers the commit, the environment variables and the path, size and
+    modification time of every file under the quadlet directory. Hidden
+    directories such as .git are skipped; when the quadlet directory is the
+    repository root, Git's own bookkeeping would otherwise change the
+    fingerprint on every fetch.
+
+    Args:
+        quadlet_dir: Directory containing the application's quadlet files
+        env: Environment variables of the application
+        commit_hash: Deployed commit
+
+    Returns:
+        Hex digest of the inputs
+    """
+    digest = hashlib.sha256(commit_hash.encode())
+    for key, value in sorted((env or {}).items()):
+        digest.update(f"\0{key}={value}".encode())
+
+    files = []
+    for root, dir_names, names in os.walk(quadlet_dir):
+        dir_names[:] = [dir_name for dir_name in dir_names if not dir_name.startswith('.')]
+        for name in names:
+            file_stat = os.stat(os.path.join(root, name))
+            files.append((os.path.relpath(os.path.join(root, name), quadlet_dir),
+                          file_stat.st_size, file_stat.st_mtime_ns))
+    for path, size, mtime_ns in sorted(files):
+        digest.update(f"\0{path}:{size}:{mtime_ns}".encode())
+
+    return digest.hexdigest()
+
 class ApplicationManager:
     """Manages the lifecycle and operations of multiple applications."""
 
@@ -46,8 +91,21 @@ class ApplicationManager:
         if git_ops and hasattr(git_ops, 'config') and hasattr(git_ops, 'work_dir'):
             self.git_manager.repositories[git_ops.config.repository_url] = git_ops
 
-        # Track processed applications to avoid duplicate processing
-        self.processed_apps: Set[str] = set()
+        # Applications whose last processing in this process succeeded,
+        # republished as a new frozenset after each batch so readers never need a lock
+        self.processed_apps: FrozenSet[str] = frozenset()
+
+        # Reverse index of service name to application, built on first lookup
+        self._service_to_app: Optional[Dict[str, str]] = None
+
+        # Static configuration part of each application's status, together with
+        # the ApplicationConfig it was built from so a reloaded config rebuilds it
+        self._config_info_cache: Dict[str, Tuple[ApplicationConfig, Dict[str, Any]]] = {}
+
+        # Git work directory of each application, and quadlet directories known to exist
+        self._repos_root = Path(str(config.system.config_dir)) / "repos"
+        self._app_work_dirs: Dict[str, Path] = {}
+        self._known_quadlet_dirs: Set[Path] = set()
 
     def get_app_list(self) -> List[str]:
         """Get a list of enabled applications.
@@ -87,12 +145,7 @@ class ApplicationManager:
             app_status = self.state_manager.get_app_status_summary(app_name)
 
             # Add configuration info if not already included
-            if "config" not in app_status:
-                app_status["config"] = {
-                    "description": app_config.description,
-                    "quadlet_dir": str(app_config.quadlet_dir),
-                    "env_var_count": len(app_config.env or {})
-                }
+            app_status.setdefault("config", self._config_info(app_config))
 
             return app_status
 
@@ -100,6 +153,162 @@ class ApplicationManager:
             logger.error(f"Failed to get status for application {app_name}: {e}")
             return {"status": "error", "error": str(e)}
 
+    def _config_info(self, app_config: ApplicationConfig) -> Dict[str, Any]:
+        """Get the configuration details included in an application's status.
+
+        The details only change with the configuration, so they are built once
+        per ApplicationConfig and shared by all status results.
+        """
+        cached = self._config_info_cache.get(app_config.name)
+        if cached is not None and cached[0] is app_config:
+            return cached[1]
+
+        info = {
+            "description": app_config.description,
+            "quadlet_dir": app_config.quadlet_dir_str,
+            "env_var_count": app_config.env_var_count
+        }
+        self._config_info_cache[app_config.name] = (app_config, info)
+        return info
+
+    def _get_status_configured_applications(self) -> Dict[str, Dict[str, Any]]:
+        """Get the status of every configured application with one batch of queries.
+
+        Returns:
+            Dictionary of application names and their status
+        """
+        app_names = self.get_app_list()
+        try:
+            summaries = self.state_manager.get_status_summaries(app_names)
+        except Exception as e:
+            logger.error(f"Failed to get status summaries of applications: {e}")
+            return {app_name: {"status": "error", "error": str(e)} for app_name in app_names}
+
+        statuses = {}
+        for app_name in app_names:
+            app_config = self.get_app_config(app_name)
+            if not app_config:
+                statuses[app_name] = {"status": "not_configured", "error": "Application not configured"}
+                continue
+            app_status = summaries[app_name]
+            app_status.setdefault("config", self._config_info(app_config))
+            statuses[app_name] = app_status
+        return statuses
+
+    def get_status_all_applications(self) -> Dict[str, Dict[str, Any]]:
+        """Get status of all applications, including the live systemd state of their services.
+
+        Returns:
+            Dictionary of application names and their status
+        """
+        try:
+            statuses = self.state_manager.get_status_all_applications()
+        except Exception as e:
+            logger.error(f"Failed to get status of all applications from state: {e}")
+            statuses = self._get_status_configured_applications()
+
+        # Query systemd once for every service of every application
+        service_names = [
+            service_name
+            for status in statuses.values()
+            for service_name in status.get("services", {})
+        ]
+        systemd_statuses = self.systemd_manager.get_many_service_statuses(service_names)
+
+        for status in statuses.values():
+            status["systemd"] = {
+                service_name: systemd_statuses.get(service_name, {})
+                for service_name in status.get("services", {})
+            }
+
+        return statuses
+
+    def get_summaries_all_applications(self) -> Dict[str, Dict[str, Any]]:
+        """Get a light status summary of all applications.
+
+        Only aggregate fields are included (overall status, service and state
+        counts, last deployment, error count); individual services and their
+        systemd state are not queried.
+
+        Returns:
+            Dictionary of application names and their summaries
+        """
+        return self.state_manager.get_app_summaries()
+
+    def find_app_for_service(self, service_name: str) -> Optional[str]:
+        """Find the application a service belongs to.
+
+        Args:
+            service_name: Name of the service
+
+        Returns:
+            Application name or None if the service is unknown
+        """
+        if self._service_to_app is None or service_name not in self._service_to_app:
+            # Build (or refresh, for services deployed since) the index in one query
+            self._service_to_app = self.state_manager.get_service_app_map()
+        return self._service_to_app.get(service_name)
+
+    def get_service_status(self, service_name: str, app_name: Optional[str] = None) -> Dict[str, Any]:
+        """Get the status of a single service.
+
+        Args:
+            service_name: Name of the service
+            app_name: Application the service belongs to (looked up if not given)
+
+        Returns:
+            Dictionary with service status details
+        """
+        try:
+            app_name = app_name or self.find_app_for_service(service_name)
+            if not app_name:
+                return {"status": "not_found", "error": f"Service {service_name} not found in any application"}
+
+            return {
+                "service_name": service_name,
+                "app_name": app_name,
+                "state": self.state_manager.get_service_state(app_name, service_name),
+                "systemd": self.systemd_manager.get_service_status(service_name)
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to get status for service {service_name}: {e}")
+            return {"status": "error", "error": str(e)}
+
+    def _fail_deployment(self,
+                         app_name: str,
+                         error_message: str,
+                         deployment_id: Optional[int] = None,
+                         commit_hash: str = "local") -> bool:
+        """Record a failed deployment.
+
+        Finishes the in-progress deployment if one was started, otherwise
+        records a new failed deployment.
+
+        Args:
+            app_name: Name of the application
+            error_message: Reason for the failure
+            deployment_id: ID of the in-progress deployment, if any
+            commit_hash: Commit to record when no deployment was started
+
+        Returns:
+            Always False, so callers can return the result directly
+        """
+        if deployment_id:
+            self.state_manager.finish_deployment(
+                deployment_id=deployment_id,
+                status="failed",
+                error_message=error_message
+            )
+        else:
+            self.state_manager.record_deployment(
+                app_name=app_name,
+                commit_hash=commit_hash,
+                status="failed",
+                error_message=error_message
+            )
+        return False
+
     def process_application(self, app_name: str) -> bool:
         """Process an application for deployment.
 
@@ -109,8 +318,11 @@ class ApplicationManager:
         Returns:
             Success status
         """
+        # Set once the outcome of this deployment has been written, so a later
+        # exception does not record it a second time
+        outcome_recorded = False
         try:
-            logger.info(f"Processing application: {app_name}")
+            logger.info("Processing application: %s", app_name)
 
             # Check if application is configured
             app_config = self.get_app_config(app_name)
@@ -118,11 +330,13 @@ class ApplicationManager:
                 logger.error(f"Configuration for application {app_name} not found")
                 return False
 
-            # Register application in state manager with description
-            self.state_manager.register_application(
-                app_name=app_name,
-                description=app_config.description
-            )
+            # Register application in state manager with description, unless this
+            # process already processed it successfully
+            if app_name not in self.processed_apps:
+                self.state_manager.register_application(
+                    app_name=app_name,
+                    description=app_config.description
+                )
 
             # Initialize default values
             quadlet_dir = app_config.quadlet_dir
@@ -145,75 +359,96 @@ class ApplicationManager:
                     return False
 
                 # Create a proper work directory path
-                work_dir = Path(str(self.config.system.config_dir)) / "repos" / app_name
-                logger.debug(f"Git work directory for {app_name}: {work_dir}")
+                work_dir = self._app_work_dirs.get(app_name)
+                if work_dir is None:
+                    work_dir = self._repos_root / app_name
+                    self._app_work_dirs[app_name] = work_dir
+                logger.debug("Git work directory for %s: %s", app_name, work_dir)
 
                 # Get or create GitOperations instance
                 git_ops = self.git_manager.get_git_ops(git_config, work_dir)
 
                 # Validate the repository worktree directory exists
                 repo_dir = git_ops.work_dir
-                if not repo_dir.exists():
-                    logger.info(f"Creating repository directory: {repo_dir}")
-                    repo_dir.mkdir(parents=True, exist_ok=True)
-
-                    # Initial clone if repository doesn't exist
-                    if not (repo_dir / ".git").exists():
-                        if not git_ops.clone_repository():
-                            logger.error(f"Failed to clone repository for {app_name}")
-                            self.state_manager.record_deployment(
-                                app_name=app_name,
-                                commit_hash="none",
-                                status="failed",
-                                error_message="Git clone failed"
-                            )
-                            return False
+                with self.git_manager.repo_lock(git_ops.config.repository_url):
+                    # Only directories applications deploy from need to be checked out
+                    if app_config.quadlet_dir and not app_config.quadlet_dir.is_absolute():
+                        git_ops.include_path(str(app_config.quadlet_dir))
+
+                    if not repo_dir.exists():
+                        logger.info("Creating repository directory: %s", repo_dir)
+                        repo_dir.mkdir(parents=True, exist_ok=True)
+
+                        # Initial clone if repository doesn't exist
+                        if not (repo_dir / ".git").exists():
+                            if not git_ops.clone_repository():
+                                logger.error(f"Failed to clone repository for {app_name}")
+                                outcome_recorded = True
+                                return self._fail_deployment(app_name, "Git clone failed", commit_hash="none")
 
                 # Check for changes (uses cached result if already checked)
-                if not self.git_manager.check_for_changes(git_ops):
+                has_changes = self.git_manager.check_for_changes(git_ops)
+                if not has_changes:
+                    # Nothing changed since this process last processed the application successfully
+                    if app_name in self.processed_apps:
+                        logger.info("No changes detected and last deployment was successful - skipping deployment for %s", app_name)
+                        return True
+
                     # No changes detected, get the last successful deployment
                     last_deployment = self.state_manager.get_last_successful_deployment(app_name)
                     if last_deployment and last_deployment.status == "success":
-                        logger.info(f"No changes detected and last deployment was successful - skipping deployment for {app_name}")
+                        logger.info("No changes detected and last deployment was successful - skipping deployment for %s", app_name)
                         return True
                     else:
-                        logger.info(f"No changes detected but last deployment wasn't successful - proceeding with deployment for {app_name}")
-
-                # Update repository
-                if git_ops.config.repository_url in self.git_manager.repos_with_changes:
-                    if not git_ops.pull_changes():
-                        logger.error(f"Failed to pull changes from Git repository")
-                        # Record failed deployment
-                        self.state_manager.record_deployment(
-                            app_name=app_name,
-                            commit_hash=git_ops.get_current_commit(),
-                            status="failed",
-                            error_message="Git pull failed"
-                        )
-                        return False
+                        logger.info("No changes detected but last deployment wasn't successful - proceeding with deployment for %s", app_name)
+
+                with self.git_manager.repo_lock(git_ops.config.repository_url):
+                    # Update repository
+                    if has_changes:
+                        if not git_ops.pull_changes():
+                            logger.error(f"Failed to pull changes from Git repository")
+                            failed_commit = git_ops.get_current_commit()
+                            outcome_recorded = True
+                            return self._fail_deployment(app_name, "Git pull failed", commit_hash=failed_commit)
 
-                # Get current commit hash
-                commit_hash = git_ops.get_current_commit()
+                    # Get current commit hash
+                    commit_hash = git_ops.get_current_commit()
 
                 # Construct a valid quadlet directory path from the repository
                 if app_config.quadlet_dir:
                     # If app_config.quadlet_dir is a relative path, combine with repo directory
                     if not app_config.quadlet_dir.is_absolute():
-                        quadlet_dir = git_ops.work_dir / str(app_config.quadlet_dir)
-                        logger.debug(f"Using relative quadlet path: {quadlet_dir}")
+                        quadlet_dir = git_ops.work_dir / app_config.quadlet_dir
+                        logger.debug("Using relative quadlet path: %s", quadlet_dir)
                     else:
                         # Use absolute path directly
                         quadlet_dir = app_config.quadlet_dir
-                        logger.debug(f"Using absolute quadlet path: {quadlet_dir}")
+                        logger.debug("Using absolute quadlet path: %s", quadlet_dir)
                 else:
                     logger.error(f"quadlet_dir is None for application {app_name}")
                     return False
 
-            # Validate that quadlet_dir exists
-            if not quadlet_dir.exists():
-                logger.error(f"Quadlet directory does not exist: {quadlet_dir}")
-                os.makedirs(quadlet_dir, exist_ok=True)
-                logger.info(f"Created quadlet directory: {quadlet_dir}")
+            # Make sure quadlet_dir exists; directories are not removed at runtime,
+            # so each is checked only once, with mkdir alone rather than stat + mkdir
+            if quadlet_dir not in self._known_quadlet_dirs:
+                try:
+                    quadlet_dir.mkdir(parents=True)
+                    logger.warning(f"Quadlet directory did not exist, created it: {quadlet_dir}")
+                except FileExistsError:
+                    pass
+                except OSError as e:
+                    logger.error(f"Failed to create quadlet directory {quadlet_dir}: {e}")
+                    outcome_recorded = True
+                    return self._fail_deployment(
+                        app_name, f"Failed to create quadlet directory: {e}", commit_hash=commit_hash
+                    )
+                self._known_quadlet_dirs.add(quadlet_dir)
+
+            # Skip the deployment if its inputs match the last successful one
+            fingerprint = _deployment_fingerprint(quadlet_dir, app_config.env, commit_hash)
+            if self._is_deployed_and_healthy(app_name, fingerprint):
+                logger.info("Quadlet files, environment and commit unchanged and all services healthy - skipping deployment for %s", app_name)
+                return True
 
             # Start a new deployment in the state manager
             deployment_id = self.state_manager.start_deployment(
@@ -222,98 +457,97 @@ class ApplicationManager:
             )
 
             # Process and deploy quadlet files
-            logger.info(f"Processing quadlet files for {app_name} from {quadlet_dir}")
+            logger.info("Processing quadlet files for %s from %s", app_name, quadlet_dir)
             success, deployed_services = self.quadlet_handler.process_and_deploy_app_quadlets(
                 app_name=app_name,
                 quadlet_dir=quadlet_dir,
-                env_vars=app_config.env
+                env_vars=app_config.template_env
             )
 
             if not success:
                 logger.error(f"Failed to process quadlet files for application {app_name}")
-                # Finish deployment as failed
-                self.state_manager.finish_deployment(
-                    deployment_id=deployment_id,
-                    status="failed",
-                    error_message="Failed to process quadlet files"
-                )
-                return False
+                outcome_recorded = True
+                return self._fail_deployment(app_name, "Failed to process quadlet files", deployment_id)
 
-            # Reload systemd daemon
-            if not self.systemd_manager.reload_daemon():
+            # Reload systemd daemon if any unit file changed
+            if not self.systemd_manager.reload_daemon_if_needed():
                 logger.error("Failed to reload systemd daemon")
-                self.state_manager.finish_deployment(
-                    deployment_id=deployment_id,
-                    status="failed",
-                    error_message="Failed to reload systemd daemon"
-                )
-                return False
+                outcome_recorded = True
+                return self._fail_deployment(app_name, "Failed to reload systemd daemon", deployment_id)
 
-            # Start services
-            logger.info(f"Starting services for application {app_name}: {deployed_services}")
-            all_started = True
+            # Start services; their state is recorded once the start jobs finished
+            logger.info("Starting services for application %s: %s", app_name, deployed_services)
+
+            # Any cached health result predates this start
             for service_name in deployed_services:
-                logger.info(f"Starting service: {service_name}")
+                self.health_checker.invalidate_health_cache(service_name)
+                if self._service_to_app is not None:
+                    self._service_to_app[service_name] = app_name
 
-                # Update service state to starting
-                self.state_manager.update_service(
-                    app_name=app_name,
-                    service_name=service_name,
-                    state="starting",
-                    deployment_id=deployment_id
-                )
+            # Start all services in one batch: a single systemctl call, or StartUnit
+            # jobs queued together over D-Bus before waiting for their results
+            start_results = self.systemd_manager.start_services(deployed_services)
 
-                # Start the service
-                if not self.systemd_manager.start_service(service_name):
-                    logger.error(f"Failed to start service {service_name}")
-                    self.state_manager.update_service(
-                        app_name=app_name,
-                        service_name=service_name,
-                        state="failed",
-                        deployment_id=deployment_id
-                    )
-                    self.state_manager.set_last_error(
-                        app_name=app_name,
-                        service_name=service_name,
-                        error_message="Failed to start service"
-                    )
-                    all_started = False
-                else:
-                    logger.info(f"Service {service_name} started successfully")
-                    self.state_manager.update_service(
-                        app_name=app_name,
-                        service_name=service_name,
-                        state="running",
-                        deployment_id=deployment_id
-                    )
+            # Record the outcome of all starts in one transaction
+            all_started = True
+            with self.state_manager.transaction():
+                for service_name, started in start_results.items():
+                    if not started:
+                        logger.error(f"Failed to start service {service_name}")
+                        self.state_manager.update_service(
+                            app_name=app_name,
+                            service_name=service_name,
+                            state="failed",
+                            deployment_id=deployment_id
+                        )
+                        self.state_manager.set_last_error(
+                            app_name=app_name,
+                            service_name=service_name,
+                            error_message="Failed to start service"
+                        )
+                        all_started = False
+                    else:
+                        logger.info("Service %s started successfully", service_name)
+                        self.state_manager.update_service(
+                            app_name=app_name,
+                            service_name=service_name,
+                            state="running",
+                            deployment_id=deployment_id
+                        )
 
             if not all_started:
                 logger.error(f"Some services failed to start for application {app_name}")
-                self.state_manager.finish_deployment(
-                    deployment_id=deployment_id,
-                    status="failed",
-                    error_message="Some services failed to start"
-                )
-                return False
+                outcome_recorded = True
+                return self._fail_deployment(app_name, "Some services failed to start", deployment_id)
 
             # Perform health checks
-            logger.info(f"Performing health checks for application {app_name}")
+            logger.info("Performing health checks for application %s", app_name)
             all_healthy = True
 
-            for service_name in deployed_services:
-                try:
-                    # Log before health check
-                    logger.info(f"Checking health of service {service_name} in app {app_name}")
+            # Check all services with a single podman query
+            health_results = self._check_services_health(deployed_services)
 
-                    # Use the existing HealthChecker to check container health
-                    health_data = self.health_checker.check_container_health(service_name)
-
-                    # Log health check result
-                    logger.info(f"Health check result for {service_name}: {health_data}")
+            # Record all results in one transaction
+            with self.state_manager.transaction():
+                for service_name, (health_data, logs, error) in health_results.items():
+                    if error is not None:
+                        logger.error(f"Error checking health for service {service_name}: {error}")
+                        self.state_manager.update_service(
+                            app_name=app_name,
+                            service_name=service_name,
+                            state="unknown",
+                            deployment_id=deployment_id
+                        )
+                        self.state_manager.set_last_error(
+                            app_name=app_name,
+                            service_name=service_name,
+                            error_message=f"Health check error: {error}"
+                        )
+                        all_healthy = False
 
                     # Update state based on health
-                    if health_data.get("healthy", False):
-                        logger.info(f"Service {service_name} is healthy")
+                    elif health_data.get("healthy", False):
+                        logger.info("Service %s is healthy", service_name)
                         self.state_manager.update_service(
                             app_name=app_name,
                             service_name=service_name,
@@ -342,94 +576,231 @@ class ApplicationManager:
                         )
                         all_healthy = False
 
-                        # Get container logs for debugging
-                        logs = self.health_checker.get_container_logs(service_name)
+                        # Container logs for debugging
                         if logs:
-                            logger.info(f"Container logs for {service_name}:\n{logs[:500]}...")
-
-                except Exception as e:
-                    logger.error(f"Error checking health for service {service_name}: {e}")
-                    self.state_manager.update_service(
-                        app_name=app_name,
-                        service_name=service_name,
-                        state="unknown",
-                        deployment_id=deployment_id
-                    )
-                    self.state_manager.set_last_error(
-                        app_name=app_name,
-                        service_name=service_name,
-                        error_message=f"Health check error: {str(e)}"
-                    )
-                    all_healthy = False
+                            logger.info("Container logs for %s:\n...%s", service_name, logs)
 
             # Wait for containers to become healthy
             if all_healthy:
-                logger.info(f"All services for application {app_name} are initially healthy")
-
-                # Optional: Wait for containers to become fully stable
-                logger.info(f"Waiting for all services in {app_name} to stabilize...")
-                for service_name in deployed_services:
-                    if not self.health_checker.wait_for_healthy(service_name, timeout=30):
-                        logger.warning(f"Service {service_name} did not stabilize within timeout period")
-                        all_healthy = False
-                        self.state_manager.update_service(
-                            app_name=app_name,
-                            service_name=service_name,
-                            state="unstable",
-                            deployment_id=deployment_id
-                        )
-                        self.state_manager.set_last_error(
-                            app_name=app_name,
-                            service_name=service_name,
-                            error_message="Service did not stabilize within timeout period"
-                        )
+                logger.info("All services for application %s are initially healthy", app_name)
+
+                # Optional: Wait for containers to become fully stable, all at once so
+                # the total wait is bounded by one timeout rather than one per service
+                logger.info("Waiting for all services in %s to stabilize...", app_name)
+                stable = self.health_checker.wait_for_many_healthy(deployed_services, timeout=30)
+                with self.state_manager.transaction():
+                    for service_name, is_stable in stable.items():
+                        if not is_stable:
+                            logger.warning(f"Service {service_name} did not stabilize within timeout period")
+                            all_healthy = False
+                            self.state_manager.update_service(
+                                app_name=app_name,
+                                service_name=service_name,
+                                state="unstable",
+                                deployment_id=deployment_id
+                            )
+                            self.state_manager.set_last_error(
+                                app_name=app_name,
+                                service_name=service_name,
+                                error_message="Service did not stabilize within timeout period"
+                            )
 
             # Record final deployment status
             if all_healthy:
-                self.state_manager.finish_deployment(
-                    deployment_id=deployment_id,
-                    status="success"
-                )
-                logger.info(f"Application {app_name} deployed successfully with all services healthy")
-                self.processed_apps.add(app_name)
+                outcome_recorded = True
+                with self.state_manager.transaction():
+                    self.state_manager.finish_deployment(
+                        deployment_id=deployment_id,
+                        status="success"
+                    )
+                    self.state_manager.register_application(app_name, config_hash=fingerprint)
+                logger.info("Application %s deployed successfully with all services healthy", app_name)
                 return True
             else:
-                self.state_manager.finish_deployment(
-                    deployment_id=deployment_id,
-                    status="failed",
-                    error_message="Some services are unhealthy or unstable"
-                )
                 logger.error(f"Application {app_name} deployment completed but some services are unhealthy")
-                return False
+                outcome_recorded = True
+                return self._fail_deployment(app_name, "Some services are unhealthy or unstable", deployment_id)
 
         except Exception as e:
             logger.error(f"Error processing application {app_name}: {e}", exc_info=True)
-            # Record error if deployment was started
+            if outcome_recorded:
+                return False
+
+            # Record error, finishing the deployment if one was started
             try:
-                if deployment_id:
-                    self.state_manager.finish_deployment(
-                        deployment_id=deployment_id,
-                        status="failed",
-                        error_message=str(e)
-                    )
-                else:
-                    commit = "local"
-                    if git_ops:
-                        try:
-                            commit = git_ops.get_current_commit()
-                        except:
-                            pass
-
-                    self.state_manager.record_deployment(
-                        app_name=app_name,
-                        commit_hash=commit,
-                        status="failed",
-                        error_message=str(e)
-                    )
+                commit = "local"
+                if git_ops and not deployment_id:
+                    try:
+                        commit = git_ops.get_current_commit()
+                    except:
+                        pass
+
+                self._fail_deployment(app_name, str(e), deployment_id, commit_hash=commit)
             except Exception as record_error:
                 logger.error(f"Failed to record deployment failure: {record_error}")
             return False
 
+    def _is_deployed_and_healthy(self, app_name: str, fingerprint: str) -> bool:
+        """Check whether an application is already deployed from the same inputs.
+
+        Args:
+            app_name: Name of the application
+            fingerprint: Fingerprint of the deployment inputs
+
+        Returns:
+            True if the last deployment succeeded with the same fingerprint and
+            all of its services are still healthy
+        """
+        try:
+            if self.state_manager.get_config_hash(app_name) != fingerprint:
+                return False
+
+            last = self.state_manager.get_deployment_history(app_name, limit=1)
+            if not last or last[0].status != "success":
+                return False
+
+            services = list(self.state_manager.get_app_service_names(app_name))
+            if not services:
+                return False
+
+            health = self.health_checker.check_many(services)
+            return all(health_data.get("healthy", False) for health_data in health.values())
+
+        except Exception as e:
+            logger.warning(f"Could not compare {app_name} with its last deployment, redeploying: {e}")
+            return False
+
+    @staticmethod
+    def _run_per_service(func: Callable[[str], Any], service_names: List[str]) -> Dict[str, Any]:
+        """Run a blocking per-service operation for several services concurrently.
+
+        Args:
+            func: Operation taking a service name
+            service_names: Names of the services
+
+        Returns:
+            Dictionary of service names and the operation's results
+        """
+        if not service_names:
+            return {}
+        if len(service_names) == 1:
+            return {service_names[0]: func(service_names[0])}
+
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_SERVICES, len(service_names))) as executor:
+            return dict(zip(service_names, executor.map(func, service_names)))
+
+    def _check_services_health(
+        self, service_names: List[str]
+    ) -> Dict[str, Tuple[Dict[str, Any], Optional[str], Optional[str]]]:
+        """Check the health of several services, fetching logs of unhealthy ones.
+
+        Args:
+            service_names: Names of the services
+
+        Returns:
+            Dictionary of service names and tuples of (health data, container
+            logs if unhealthy, error message if the check failed)
+        """
+        try:
+            logger.info("Checking health of services %s", service_names)
+            health = self.health_checker.check_many(service_names)
+        except Exception as e:
+            return {service_name: ({}, None, str(e)) for service_name in service_names}
+
+        unhealthy = [name for name in service_names if not health[name].get("healthy", False)]
+        logs = self._run_per_service(
+            lambda service_name: self.health_checker.get_container_logs(
+                service_name, lines=LOG_EXCERPT_LINES, max_bytes=LOG_EXCERPT_BYTES
+            ),
+            unhealthy
+        )
+        return {name: (health[name], logs.get(name), None) for name in service_names}
+
+    def _record_service_results(self, app_name: str, results: Dict[str, bool], state: str) -> bool:
+        """Record the outcome of a start or stop of an application's services.
+
+        Args:
+            app_name: Name of the application
+            results: Dictionary of service names and their success status
+            state: State to record for services that succeeded
+
+        Returns:
+            True if every service succeeded
+        """
+        with self.state_manager.transaction():
+            for service_name, success in results.items():
+                self.state_manager.update_service(app_name, service_name, state if success else "error")
+        return all(results.values())
+
+    def start_application(self, app_name: str) -> bool:
+        """Start all deployed services of an application.
+
+        Args:
+            app_name: Name of the application
+
+        Returns:
+            Success status
+        """
+        try:
+            services = self.state_manager.get_app_service_names(app_name)
+            if not services:
+                logger.warning(f"No deployed services found for application {app_name}")
+                return False
+
+            logger.info("Starting application: %s", app_name)
+            self.health_checker.invalidate_health_cache()
+            results = self.systemd_manager.start_services(list(services))
+
+            return self._record_service_results(app_name, results, "running")
+
+        except Exception as e:
+            logger.error(f"Error starting application {app_name}: {e}")
+            return False
+
+    def stop_application(self, app_name: str) -> bool:
+        """Stop all deployed services of an application.
+
+        Args:
+            app_name: Name of the application
+
+        Returns:
+            Success status
+        """
+        try:
+            services = self.state_manager.get_app_service_names(app_name)
+            if not services:
+                logger.warning(f"No deployed services found for application {app_name}")
+                return False
+
+            logger.info("Stopping application: %s", app_name)
+            self.health_checker.invalidate_health_cache()
+            results = self.systemd_manager.stop_services(list(services))
+
+            return self._record_service_results(app_name, results, "stopped")
+
+        except Exception as e:
+            logger.error(f"Error stopping application {app_name}: {e}")
+            return False
+
+    def restart_application(self, app_name: str) -> bool:
+        """Restart an application by stopping and then starting its services.
+
+        Args:
+            app_name: Name of the application
+
+        Returns:
+            Success status
+        """
+        if not self.stop_application(app_name):
+            logger.warning(f"Not all services of {app_name} stopped cleanly, starting anyway")
+
+        # Start again as soon as every service has shut down
+        services = list(self.state_manager.get_app_service_names(app_name))
+        if not self.systemd_manager.wait_for_inactive(services, timeout=RESTART_STOP_TIMEOUT):
+            logger.warning(f"Not all services of {app_name} shut down in time, starting anyway")
+
+        return self.start_application(app_name)
+
     def process_all_applications(self) -> Dict[str, bool]:
         """Process all enabled applications.
 
@@ -439,8 +810,44 @@ class ApplicationManager:
         # Reset the Git manager cycle
         self.git_manager.reset_cycle()
 
-        results = {}
-        for app_name in self.get_app_list():
-            results[app_name] = self.process_application(app_name)
+        return self.process_applications(self.get_app_list())
+
+    def _process_app_safe(self, app_name: str) -> Tuple[str, bool]:
+        """Process an application, treating any unexpected error as a failure.
+
+        Keeps one application's error from aborting the other deployments of
+        a parallel batch.
+
+        Args:
+            app_name: Name of the application
+
+        Returns:
+            Tuple of application name and success status
+        """
+        try:
+            return app_name, self.process_application(app_name)
+        except Exception as e:
+            logger.error(f"Unexpected error processing application {app_name}: {e}", exc_info=True)
+            return app_name, False
+
+    def process_applications(self, app_names: List[str]) -> Dict[str, bool]:
+        """Process several applications in parallel.
+
+        Deployments of different applications are independent and mostly wait
+        on Git, systemd and podman, so they run in a bounded thread pool.
+
+        Args:
+            app_names: Names of the applications
+
+        Returns:
+            Dictionary of application names and their success status
+        """
+        if not app_names:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_APPS, len(app_names))) as executor:
+            results = dict(executor.map(self._process_app_safe, app_names))
 
+        succeeded = {app_name for app_name, success in results.items() if success}
+        self.processed_apps = frozenset((self.processed_apps | succeeded) - (results.keys() - succeeded))
         return results
\ No newline at end of file
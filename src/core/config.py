@@ -1,12 +1,75 @@
+from collections.abc import MutableMapping
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, root_validator
-import toml
+from typing import Optional, List, Dict, Any, FrozenSet, Iterator, Mapping, Tuple
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
+import copy
+import functools
 import os
+import pickle
+import sys
+import tempfile
+import threading
+
+try:
+    import rtoml
+except ImportError:  # optional Rust-backed parser, see the fast-toml extra
+    rtoml = None
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
 
 import logging
 logger = logging.getLogger(__name__)
 
+def _loads_toml(toml_str: str) -> Dict[str, Any]:
+    """Parse a TOML string with the fastest available parser."""
+    if rtoml is not None:
+        return rtoml.loads(toml_str)
+    return tomllib.loads(toml_str)
+
+def _load_toml_file(file_path: Path) -> Dict[str, Any]:
+    """Parse a TOML file with the fastest available parser."""
+    if rtoml is not None:
+        return rtoml.load(Path(file_path))
+    # tomllib reads bytes, which skips a separate decode pass
+    with open(file_path, 'rb') as f:
+        return tomllib.load(f)
+
+# Loaded configurations keyed by resolved config file, together with the
+# (mtime_ns, size) signature of the files they were loaded from
+_CONFIG_CACHE: Dict[Path, Tuple[tuple, 'Config']] = {}
+
+# Bump when the pickled layout or the models change incompatibly
+COMPILED_CONFIG_VERSION = 6
+
+# Set to disable the on-disk compiled config cache (useful when debugging)
+NO_CACHE_ENV_VAR = "PODMAN_GITOPS_NO_CACHE"
+
+def config_signature(config_file: Path, config_dir: Path) -> tuple:
+    """Build a cheap change signature for a config file and its application configs.
+
+    Args:
+        config_file: Path to the main configuration file
+        config_dir: Directory containing application configuration files
+
+    Returns:
+        Tuple of (name, mtime_ns, size) entries; changes whenever any file does
+    """
+    config_stat = config_file.stat()
+    signature = [(str(config_file), config_stat.st_mtime_ns, config_stat.st_size)]
+    try:
+        with os.scandir(config_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.toml') and entry.is_file():
+                    entry_stat = entry.stat()
+                    signature.append((entry.name, entry_stat.st_mtime_ns, entry_stat.st_size))
+    except FileNotFoundError:
+        pass
+    return tuple(sorted(signature))
+
 class EnvironmentConfig(BaseModel):
     """Configuration for environment variables."""
     env_file: Optional[Path] = Field(default=None, description="Path to environment file")
@@ -16,30 +79,35 @@ class EnvironmentConfig(BaseModel):
         arbitrary_types_allowed = True
         extra = "allow"  # Allow extra fields to be included as environment variables
 
-    @root_validator(pre=True)
-    def extract_env_variables(cls, values):
-        """Extract environment variables from the config."""
-        env_file = values.get('env_file')
-        # Create a copy of the input values
-        result = dict(values)
-
-        # Move all fields except env_file to variables
-        variables = {}
-        to_remove = []
+    @model_validator(mode='before')
+    @classmethod
+    def extract_env_variables(cls, values: Any) -> Any:
+        """Move every field except env_file into variables."""
+        if not isinstance(values, Mapping):
+            return values
+        result = {'variables': {key: value for key, value in values.items() if key != 'env_file'}}
+        if 'env_file' in values:
+            result['env_file'] = values['env_file']
+        return result
 
-        for key, value in values.items():
-            if key != 'env_file':
-                variables[key] = value
-                to_remove.append(key)
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> 'EnvironmentConfig':
+        """Create an EnvironmentConfig from an [env] section.
 
-        # Remove the keys we've moved
-        for key in to_remove:
-            result.pop(key, None)
+        Every key except env_file is an environment variable.
 
-        # Set the variables field
-        result['variables'] = variables
+        Args:
+            data: Parsed [env] section
 
-        return result
+        Returns:
+            Environment configuration
+        """
+        env_file = data.get('env_file')
+        variables = {key: value for key, value in data.items() if key != 'env_file'}
+        return cls.model_construct(
+            env_file=Path(env_file) if env_file is not None else None,
+            variables=variables
+        )
 
 class GitConfig(BaseModel):
     """Configuration for Git operations."""
@@ -50,6 +118,14 @@ class GitConfig(BaseModel):
     ssh_key_password: Optional[str] = Field(default=None, description="Password for SSH key (if encrypted)")
     repo_dir: Optional[Path] = Field(default=None, description="Custom directory for repository checkout")
     quadlet_files_dir: str = Field(default="", description="Directory inside repository containing quadlet files (e.g., 'draw' or 'quadlets')")
+    shallow: bool = Field(default=False, description="Clone and fetch only the tip commit of the tracked branch; pulls then reset the checkout to it, discarding local commits and changes")
+    sparse_checkout: bool = Field(default=False, description="Check out only the directories applications deploy from, without downloading other files; files quadlets reference outside those directories are then missing")
+
+    @field_validator('repository_url')
+    @classmethod
+    def intern_repository_url(cls, value: str) -> str:
+        """Intern the URL; it keys the Git manager's per-repository dictionaries."""
+        return sys.intern(value)
 
 
 class ApplicationConfig(BaseModel):
@@ -63,32 +139,224 @@ class ApplicationConfig(BaseModel):
     class Config:
         arbitrary_types_allowed = True
 
-class MetricsConfig(BaseModel):
+    @functools.cached_property
+    def quadlet_dir_str(self) -> str:
+        """Quadlet directory as a string for status output, computed on first use."""
+        return str(self.quadlet_dir)
+
+    @functools.cached_property
+    def template_env(self) -> Mapping[str, str]:
+        """Variables for quadlet template substitution, computed on first use.
+
+        Includes APP_NAME unless env sets it, so templates can be processed
+        without copying or modifying env on every deployment. Callers must
+        not modify the returned mapping.
+        """
+        return {'APP_NAME': self.name, **self.env}
+
+    @functools.cached_property
+    def env_var_count(self) -> int:
+        """Number of configured environment variables."""
+        return len(self.env)
+
+@functools.lru_cache(maxsize=None)
+def _home_dir() -> str:
+    """Home directory of the current user, resolved once per process."""
+    return os.path.expanduser('~')
+
+def _expand_user(path: Optional[Path]) -> Optional[Path]:
+    """Expand a leading ~ in a path.
+
+    Paths that do not start with ~ are returned unchanged, which is the common
+    case for production configurations using absolute paths. The current
+    user's home directory is looked up once; ~user paths still go through
+    os.path.expanduser.
+
+    Args:
+        path: Path to expand
+
+    Returns:
+        Expanded path, or None if path is None
+    """
+    if path is None:
+        return None
+    path_str = str(path)
+    if not path_str.startswith('~'):
+        return path
+    if path_str == '~' or path_str.startswith('~/'):
+        return Path(_home_dir() + path_str[1:])
+    return Path(os.path.expanduser(path_str))
+
+def _parse_app_config(app_name: str, app_config_path: Path, validate: bool = False) -> Optional[ApplicationConfig]:
+    """Parse a single application configuration file.
+
+    Args:
+        app_name: Name of the application
+        app_config_path: Path to the application's TOML file
+        validate: Run full model validation instead of trusting the file
+
+    Returns:
+        Application configuration with expanded paths, or None if the file is missing or has no application section
+    """
+    if not app_config_path.exists():
+        logger.warning(f"Application configuration file not found for {app_name} at {app_config_path}")
+        return None
+
+    app_config_dict = _load_toml_file(app_config_path)
+
+    if 'application' not in app_config_dict:
+        logger.warning(f"No application section found in {app_config_path}")
+        return None
+
+    app_section = app_config_dict['application']
+
+    # Ensure application has a name
+    if 'name' not in app_section:
+        app_section['name'] = app_name
+
+    # Create ApplicationConfig
+    app_config = ApplicationConfig(**app_section) if validate else _construct(ApplicationConfig, app_section)
+    app_config.quadlet_dir = _expand_user(app_config.quadlet_dir)
+
+    # Add environment variables if present
+    if 'env' in app_config_dict:
+        app_config.env = {k: str(v) for k, v in app_config_dict['env'].items()}
+    else:
+        app_config.env = {}
+
+    logger.info(f"Loaded configuration for application {app_name}")
+    return app_config
+
+class LazyAppConfigs(MutableMapping):
+    """Application configurations that are parsed from disk on first access.
+
+    Commands that touch a single application only pay for parsing that
+    application's TOML file. Iterating over or counting the names only checks
+    which configuration files exist; items() and values() load all of them.
+    """
+
+    def __init__(self, config_dir: Path, app_names: List[str]):
+        """Initialize the mapping.
+
+        Args:
+            config_dir: Directory containing application configuration files
+            app_names: Names of the applications to make available
+        """
+        self._pending: Dict[str, Path] = {name: Path(config_dir) / f"{name}.toml" for name in app_names}
+        self._loaded: Dict[str, ApplicationConfig] = {}
+        # Applications are processed in parallel; without the lock a second
+        # thread could see an application as missing while the first parses it
+        self._lock = threading.RLock()
+
+    def __getitem__(self, app_name: str) -> ApplicationConfig:
+        app_config = self._loaded.get(app_name)
+        if app_config is not None:
+            return app_config
+
+        with self._lock:
+            if app_name not in self._loaded:
+                app_config_path = self._pending.pop(app_name, None)
+                app_config = _parse_app_config(app_name, app_config_path) if app_config_path else None
+                if app_config is None:
+                    raise KeyError(app_name)
+                self._loaded[app_name] = app_config
+            return self._loaded[app_name]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Locks cannot be pickled or deep-copied
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def __setitem__(self, app_name: str, app_config: ApplicationConfig) -> None:
+        with self._lock:
+            self._pending.pop(app_name, None)
+            self._loaded[app_name] = app_config
+
+    def __delitem__(self, app_name: str) -> None:
+        with self._lock:
+            if self._pending.pop(app_name, None) is None:
+                del self._loaded[app_name]
+            else:
+                self._loaded.pop(app_name, None)
+
+    def _names(self) -> List[str]:
+        """Names of loaded applications and of pending ones whose file exists."""
+        with self._lock:
+            return list(self._loaded) + [name for name, path in self._pending.items() if path.is_file()]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names())
+
+    def __len__(self) -> int:
+        return len(self._names())
+
+    def items(self):
+        """Parse every application configuration and return a view of their items."""
+        self.prefetch_all()
+        return self._loaded.items()
+
+    def values(self):
+        """Parse every application configuration and return a view of their values."""
+        self.prefetch_all()
+        return self._loaded.values()
+
+    @property
+    def loaded(self) -> Dict[str, ApplicationConfig]:
+        """Application configurations parsed so far."""
+        return self._loaded
+
+    def prefetch_all(self) -> None:
+        """Parse every application configuration that has not been loaded yet."""
+        for app_name in list(self._pending):
+            try:
+                self[app_name]
+            except KeyError:
+                pass
+
+# The configuration sections below are plain data without validation logic of
+# their own, so they are slotted dataclasses rather than pydantic models. Config
+# still validates them when built with validate=True. dataclass(slots=True)
+# needs Python 3.10; older interpreters get regular dataclasses.
+_DATACLASS_OPTIONS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
+class MetricsConfig:
     """Configuration for metrics endpoint."""
-    enabled: bool = Field(default=True, description="Enable metrics endpoint")
-    port: int = Field(default=8000, description="Port for metrics endpoint")
-    host: str = Field(default="0.0.0.0", description="Host for metrics endpoint")
-    type: str = Field(default="prometheus", description="Type of metrics endpoint")
+    enabled: bool = True  # Enable metrics endpoint
+    port: int = 8000  # Port for metrics endpoint
+    host: str = "0.0.0.0"  # Host for metrics endpoint
+    type: str = "prometheus"  # Type of metrics endpoint
 
-class ApplicationsConfig(BaseModel):
+@dataclass(**_DATACLASS_OPTIONS)
+class ApplicationsConfig:
     """Configuration for applications."""
-    enabled: List[str] = Field(default_factory=list, description="List of enabled applications")
+    enabled: List[str] = field(default_factory=list)  # List of enabled applications
 
-class SystemConfig(BaseModel):
+    @property
+    def enabled_set(self) -> FrozenSet[str]:
+        """Enabled applications as a set for membership checks.
+
+        Built on every access, so it always reflects the current enabled list.
+        """
+        return frozenset(self.enabled)
+
+@dataclass(**_DATACLASS_OPTIONS)
+class SystemConfig:
     """Configuration for system settings."""
-    log_level: str = Field(default="INFO", description="Logging level")
-    state_db: Path = Field(default=Path("~/.local/lib/podman-gitops/state.db"), description="Path to state database")
-    config_dir: Optional[Path] = Field(default=None, description="Directory for application config files")
+    log_level: str = "INFO"  # Logging level
+    state_db: Path = Path("~/.local/lib/podman-gitops/state.db")  # Path to state database
+    config_dir: Optional[Path] = None  # Directory for application config files
 
-class PodmanConfig(BaseModel):
+@dataclass(**_DATACLASS_OPTIONS)
+class PodmanConfig:
     """Configuration for Podman operations."""
-    quadlet_dir: Path = Field(default=Path("~/.config/containers/systemd"),
-                             description="Directory for quadlet files")
-    backup_dir: Optional[Path] = Field(default=Path("~/.local/lib/podman-gitops/backups"),
-                                     description="Directory for backups")
-
-    class Config:
-        arbitrary_types_allowed = True
+    quadlet_dir: Path = Path("~/.config/containers/systemd")  # Directory for quadlet files
+    backup_dir: Optional[Path] = Path("~/.local/lib/podman-gitops/backups")  # Directory for backups
 
 class Config(BaseModel):
     """Main configuration model."""
@@ -99,27 +367,159 @@ class Config(BaseModel):
     app_configs: Dict[str, ApplicationConfig] = Field(default_factory=dict)
     podman: PodmanConfig = Field(default_factory=PodmanConfig)
 
+    # Set once the Podman and Git paths have been expanded
+    _paths_expanded: bool = PrivateAttr(default=False)
+
     class Config:
         arbitrary_types_allowed = True
 
     @classmethod
-    def from_toml(cls, toml_str: str) -> 'Config':
-        """Create a Config instance from a TOML string."""
+    def from_toml(cls, toml_str: str, validate: bool = False) -> 'Config':
+        """Create a Config instance from a TOML string.
+
+        The configuration is authored by the operator and trusted, so by default
+        models are built without validation; only required fields are checked
+        and Path fields converted.
+
+        Args:
+            toml_str: TOML document
+            validate: Run full model validation, e.g. for tooling that checks configs
+        """
         try:
-            config_dict = toml.loads(toml_str)
-            return cls(**config_dict)
+            config_dict = _loads_toml(toml_str)
+            return cls(**config_dict) if validate else _construct(cls, config_dict)
         except Exception as e:
             raise ValueError(f"Failed to parse TOML configuration: {e}")
 
     @classmethod
-    def from_file(cls, file_path: Path) -> 'Config':
-        """Create a Config instance from a TOML file."""
+    def from_file(cls, file_path: Path, validate: bool = False) -> 'Config':
+        """Create a Config instance from a TOML file.
+
+        Args:
+            file_path: Path to the TOML file
+            validate: Run full model validation instead of trusting the file
+        """
         try:
-            with open(file_path, 'r') as f:
-                return cls.from_toml(f.read())
+            config_dict = _load_toml_file(file_path)
+            return cls(**config_dict) if validate else _construct(cls, config_dict)
         except Exception as e:
             raise ValueError(f"Failed to read configuration file {file_path}: {e}")
 
+    @classmethod
+    def load(cls, config_file: Path, config_dir: Path, cache_file: Optional[Path] = None) -> 'Config':
+        """Load a configuration with its application configs and expanded paths.
+
+        Application configs are parsed lazily when first accessed. The result is
+        cached per process and reused until the main config or any application
+        config in config_dir changes on disk.
+
+        With a cache_file, the fully resolved configuration is also pickled there,
+        so later processes skip TOML parsing until the source files change.
+
+        Args:
+            config_file: Path to the main configuration file
+            config_dir: Directory containing application configuration files
+            cache_file: Optional path of the compiled configuration cache
+
+        Returns:
+            A private copy of the loaded configuration
+        """
+        config_file = Path(config_file).resolve()
+        signature = config_signature(config_file, Path(config_dir))
+
+        cached = _CONFIG_CACHE.get(config_file)
+        if cached and cached[0] == signature:
+            logger.debug(f"Using cached configuration for {config_file}")
+            return copy.deepcopy(cached[1])
+
+        if os.environ.get(NO_CACHE_ENV_VAR):
+            cache_file = None
+
+        config = cls._read_compiled(cache_file, signature) if cache_file else None
+        if config is None:
+            config = cls.from_file(config_file)
+            config.app_configs = LazyAppConfigs(config_dir, config.applications.enabled)
+            config.expand_paths()
+
+            if cache_file:
+                cls._write_compiled(cache_file, signature, config)
+
+        _CONFIG_CACHE[config_file] = (signature, config)
+        return copy.deepcopy(config)
+
+    @staticmethod
+    def invalidate_cache(config_file: Optional[Path] = None) -> None:
+        """Drop configurations cached in this process.
+
+        The compiled cache on disk is left alone; it is validated against the
+        source files on every load.
+
+        Args:
+            config_file: Config file whose cached configuration to drop, or None for all
+        """
+        if config_file is None:
+            _CONFIG_CACHE.clear()
+        else:
+            _CONFIG_CACHE.pop(Path(config_file).resolve(), None)
+
+    @classmethod
+    def _read_compiled(cls, cache_file: Path, signature: tuple) -> Optional['Config']:
+        """Read a compiled configuration if it matches the current source files.
+
+        Args:
+            cache_file: Path of the compiled configuration cache
+            signature: Signature of the current source files
+
+        Returns:
+            Cached configuration, or None if missing, stale or unreadable
+        """
+        try:
+            with open(cache_file, 'rb') as f:
+                compiled = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable config cache {cache_file}: {e}")
+            return None
+
+        if compiled.get('version') != COMPILED_CONFIG_VERSION or compiled.get('signature') != signature:
+            return None
+
+        logger.debug(f"Using compiled configuration from {cache_file}")
+        return compiled['config']
+
+    @staticmethod
+    def _write_compiled(cache_file: Path, signature: tuple, config: 'Config') -> None:
+        """Atomically write a compiled configuration.
+
+        Application configs not parsed yet are parsed first, so the compiled
+        cache spares later processes all parsing.
+
+        Args:
+            cache_file: Path of the compiled configuration cache
+            signature: Signature of the source files the configuration was loaded from
+            config: Fully loaded configuration
+        """
+        try:
+            if isinstance(config.app_configs, LazyAppConfigs):
+                config.app_configs.prefetch_all()
+            cache_file = Path(cache_file)
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, prefix=f".{cache_file.name}.")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(
+                        {'version': COMPILED_CONFIG_VERSION, 'signature': signature, 'config': config},
+                        f,
+                        protocol=5
+                    )
+                os.replace(tmp_path, cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            logger.warning(f"Failed to write config cache {cache_file}: {e}")
+
     # @classmethod
     # def from_directory(cls, config_dir: Path) -> 'Config':
     #     """Create a Config instance from a directory of TOML files."""
@@ -147,7 +547,7 @@ class Config(BaseModel):
     #
     #                 # Handle environment section
     #                 if 'env' in app_config_dict:
-    #                     app_config.env = EnvironmentConfig(**app_config_dict.get('env', {}))
+    #                     app_config.env = EnvironmentConfig.from_mapping(app_config_dict.get('env', {}))
     #
     #                 config.app_configs[app_name] = app_config
     #         logger.info(f"Config {config}")
@@ -158,31 +558,36 @@ class Config(BaseModel):
 
     def expand_paths(self) -> 'Config':
         """Expand all path variables to absolute paths."""
-        # Expand Podman paths
-        self.podman.quadlet_dir = Path(os.path.expanduser(str(self.podman.quadlet_dir)))
-        if self.podman.backup_dir:
-            self.podman.backup_dir = Path(os.path.expanduser(str(self.podman.backup_dir)))
+        if not self._paths_expanded:
+            # Expand Podman paths
+            self.podman.quadlet_dir = _expand_user(self.podman.quadlet_dir)
+            self.podman.backup_dir = _expand_user(self.podman.backup_dir)
+
+            # Expand Git paths
+            if self.git:
+                self.git.ssh_key_path = _expand_user(self.git.ssh_key_path)
+                self.git.repo_dir = _expand_user(self.git.repo_dir)
 
-        # Expand Git paths
-        if self.git and self.git.ssh_key_path:
-            self.git.ssh_key_path = Path(os.path.expanduser(str(self.git.ssh_key_path)))
-        if self.git and self.git.repo_dir:
-            self.git.repo_dir = Path(os.path.expanduser(str(self.git.repo_dir)))
+            self._paths_expanded = True
 
-        # Expand application paths
-        for app_name, app_config in self.app_configs.items():
-            app_config.quadlet_dir = Path(os.path.expanduser(str(app_config.quadlet_dir)))
+        # Expand application paths; lazily loaded configs are expanded as they are parsed
+        app_configs = self.app_configs
+        if isinstance(app_configs, LazyAppConfigs):
+            app_configs = app_configs.loaded
+        for app_name, app_config in app_configs.items():
+            app_config.quadlet_dir = _expand_user(app_config.quadlet_dir)
 
             # Note: we're no longer checking for environment.env_file
             # If you need to handle env_file paths, add that logic here
 
         return self
 
-    def load_app_configs(self, config_dir: Path) -> 'Config':
+    def load_app_configs(self, config_dir: Path, validate: bool = False) -> 'Config':
         """Load application configurations from a directory.
 
         Args:
             config_dir: Directory containing application configuration files
+            validate: Run full model validation instead of trusting the files
 
         Returns:
             Self with loaded application configurations
@@ -190,37 +595,80 @@ class Config(BaseModel):
         try:
             # Read application config files
             for app_name in self.applications.enabled:
-                app_config_path = config_dir / f"{app_name}.toml"
-                if not app_config_path.exists():
-                    logger.warning(f"Application configuration file not found for {app_name} at {app_config_path}")
-                    continue
-
-                with open(app_config_path, 'r') as f:
-                    app_config_dict = toml.loads(f.read())
-
-                if 'application' not in app_config_dict:
-                    logger.warning(f"No application section found in {app_config_path}")
-                    continue
-
-                app_section = app_config_dict['application']
-
-                # Ensure application has a name
-                if 'name' not in app_section:
-                    app_section['name'] = app_name
-
-                # Create ApplicationConfig
-                app_config = ApplicationConfig(**app_section)
-
-                # Add environment variables if present
-                if 'env' in app_config_dict:
-                    app_config.env = {k: str(v) for k, v in app_config_dict['env'].items()}
-                else:
-                    app_config.env = {}
-
-                self.app_configs[app_name] = app_config
-                logger.info(f"Loaded configuration for application {app_name}")
+                app_config = _parse_app_config(app_name, config_dir / f"{app_name}.toml", validate)
+                if app_config is not None:
+                    self.app_configs[app_name] = app_config
 
             return self
         except Exception as e:
             logger.error(f"Failed to load application configurations: {e}")
-            raise
\ No newline at end of file
+            raise
+
+# Fields that need converting when models are built from trusted TOML without
+# validation: Path-typed fields, and fields holding nested models
+_PATH_FIELDS: Dict[type, Tuple[str, ...]] = {
+    GitConfig: ('ssh_key_path', 'repo_dir'),
+    ApplicationConfig: ('quadlet_dir',),
+    SystemConfig: ('state_db', 'config_dir'),
+    PodmanConfig: ('quadlet_dir', 'backup_dir'),
+}
+_NESTED_FIELDS: Dict[type, Dict[str, type]] = {
+    ApplicationConfig: {'git': GitConfig},
+    Config: {
+        'system': SystemConfig,
+        'git': GitConfig,
+        'metrics': MetricsConfig,
+        'applications': ApplicationsConfig,
+        'podman': PodmanConfig,
+    },
+}
+# String fields used as dictionary keys, interned so lookups can compare by identity
+_INTERNED_FIELDS: Dict[type, Tuple[str, ...]] = {
+    GitConfig: ('repository_url',),
+}
+_REQUIRED_FIELDS: Dict[type, Tuple[str, ...]] = {
+    model_cls: tuple(name for name, model_field in model_cls.model_fields.items() if model_field.is_required())
+    for model_cls in (GitConfig, ApplicationConfig, Config)
+}
+# Constructor arguments of the dataclass sections; other keys are ignored like
+# pydantic ignores unknown fields
+_DATACLASS_FIELDS: Dict[type, FrozenSet[str]] = {
+    section_cls: frozenset(section_field.name for section_field in fields(section_cls) if section_field.init)
+    for section_cls in (SystemConfig, PodmanConfig, MetricsConfig, ApplicationsConfig)
+}
+
+def _construct(model_cls: type, data: Mapping[str, Any]) -> Any:
+    """Build a model from trusted, already parsed data without validating it.
+
+    Args:
+        model_cls: Model or dataclass section to build
+        data: Field values, with nested models as mappings
+
+    Returns:
+        Model instance with Path fields and nested models converted and key strings interned
+
+    Raises:
+        ValueError: If a required field is missing
+    """
+    missing = [name for name in _REQUIRED_FIELDS.get(model_cls, ()) if name not in data]
+    if missing:
+        raise ValueError(f"{model_cls.__name__} is missing required fields: {', '.join(missing)}")
+
+    values = dict(data)
+    for name in _PATH_FIELDS.get(model_cls, ()):
+        value = values.get(name)
+        if value is not None and not isinstance(value, Path):
+            values[name] = Path(value)
+    for name in _INTERNED_FIELDS.get(model_cls, ()):
+        value = values.get(name)
+        if isinstance(value, str):
+            values[name] = sys.intern(value)
+    for name, nested_cls in _NESTED_FIELDS.get(model_cls, {}).items():
+        value = values.get(name)
+        if isinstance(value, Mapping):
+            values[name] = _construct(nested_cls, value)
+
+    init_fields = _DATACLASS_FIELDS.get(model_cls)
+    if init_fields is not None:
+        return model_cls(**{name: value for name, value in values.items() if name in init_fields})
+    return model_cls.model_construct(**values)
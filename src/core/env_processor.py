@@ -1,16 +1,101 @@
+import functools
 import logging
 import os
+import re
 import stat
 from string import Template
 from pathlib import Path
-from typing import Dict, Optional
+from typing import ClassVar, Dict, Mapping, Optional, Set
 from dotenv import dotenv_values
 
 logger = logging.getLogger(__name__)
 
+# A KEY=value line whose value needs no unquoting, escaping, interpolation
+# or comment stripping
+_SIMPLE_ENV_LINE_RE = re.compile(r'([A-Za-z_][A-Za-z0-9_]*)=([^\s\'"\\$#]*)')
+
+def _parse_env_file(env_file: Path, strict: bool = False) -> Dict[str, Optional[str]]:
+    """Parse a .env file.
+
+    Files made only of simple KEY=value lines, comments and blank lines are
+    parsed with a regex. Anything else, or strict=True, uses python-dotenv,
+    which yields the same values for simple files.
+
+    Args:
+        env_file: Path to the .env file
+        strict: Always parse with python-dotenv
+
+    Returns:
+        Variables defined in the file
+    """
+    if not strict:
+        variables = {}
+        for line in env_file.read_text().splitlines():
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            match = _SIMPLE_ENV_LINE_RE.fullmatch(line)
+            if match is None:
+                break
+            variables[match.group(1)] = match.group(2)
+        else:
+            return variables
+    return dotenv_values(env_file)
+
+@functools.lru_cache(maxsize=64)
+def _parse_env_file_cached(path: str, mtime_ns: int, size: int, strict: bool) -> Dict[str, Optional[str]]:
+    """Parse a .env file, memoized on its path and (mtime_ns, size) signature.
+
+    Callers must not modify the returned dictionary.
+    """
+    return _parse_env_file(Path(path), strict)
+
+def _open_private(path: str, flags: int) -> int:
+    """Opener for open() that creates files readable only by the owner.
+
+    Existing files keep their mode on open, so one left with wider
+    permissions is tightened as well.
+    """
+    fd = os.open(path, flags, 0o600)
+    try:
+        if stat.S_IMODE(os.fstat(fd).st_mode) != 0o600:
+            os.fchmod(fd, 0o600)
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+class _TrackingEnv:
+    """Variables for template substitution that record names they do not define."""
+
+    __slots__ = ('env_vars', 'missing')
+
+    def __init__(self, env_vars: Mapping[str, str]):
+        self.env_vars = env_vars
+        self.missing = set()
+
+    def __getitem__(self, name: str) -> str:
+        try:
+            return self.env_vars[name]
+        except KeyError:
+            self.missing.add(name)
+            raise
+
+@functools.lru_cache(maxsize=128)
+def _compile_template(path: str, mtime_ns: int, size: int) -> Template:
+    """Read a template file, memoized on its path and (mtime_ns, size) signature.
+
+    Quadlet templates are re-processed on every deployment but rarely change,
+    so only the substitution has to run again for an unchanged file.
+    """
+    return Template(Path(path).read_text())
+
 class EnvProcessor:
     """Processes environment variables and handles template substitution."""
 
+    # Directories already known to exist, shared by all instances of the process
+    _verified_dirs: ClassVar[Set[str]] = set()
+
     def __init__(self, base_dir: Optional[Path] = None):
         """Initialize the environment processor.
 
@@ -21,18 +106,29 @@ class EnvProcessor:
         self._ensure_directory(self.base_dir)
 
     def _ensure_directory(self, directory: Path) -> None:
-        """Ensure a directory exists with secure permissions."""
+        """Ensure a directory exists with secure permissions.
+
+        Directories verified once are not checked again.
+        """
+        key = str(directory)
+        if key in self._verified_dirs:
+            return
         if not directory.exists():
             directory.mkdir(parents=True, mode=0o700)  # Secure permissions
         elif not directory.is_dir():
             raise ValueError(f"{directory} exists but is not a directory")
+        self._verified_dirs.add(key)
 
-    def load_environment(self, env_file: Optional[Path], variables: Dict[str, str]) -> Dict[str, str]:
+    def load_environment(self, env_file: Optional[Path], variables: Dict[str, str],
+                         strict: bool = False) -> Dict[str, str]:
         """Load environment variables from a file and merge with provided variables.
 
+        The file is only parsed again when it changes.
+
         Args:
             env_file: Path to .env file
             variables: Dictionary of variables to include
+            strict: Always parse the file with python-dotenv
 
         Returns:
             Dict of environment variables
@@ -40,10 +136,19 @@ class EnvProcessor:
         env_vars = {}
 
         # Load from env file if provided
-        if env_file and env_file.exists():
+        env_stat = None
+        if env_file:
+            try:
+                env_stat = env_file.stat()
+            except FileNotFoundError:
+                pass
+
+        if env_stat is not None:
             try:
                 logger.info(f"Loading environment from {env_file}")
-                env_from_file = dotenv_values(env_file)
+                env_from_file = _parse_env_file_cached(
+                    str(env_file), env_stat.st_mtime_ns, env_stat.st_size, strict
+                )
                 env_vars.update(env_from_file)
                 logger.debug(f"Loaded {len(env_from_file)} variables from {env_file}")
             except Exception as e:
@@ -60,7 +165,7 @@ class EnvProcessor:
 
         return env_vars
 
-    def process_template(self, template_path: Path, env_vars: Dict[str, str]) -> str:
+    def process_template(self, template_path: Path, env_vars: Mapping[str, str]) -> str:
         """Process a template file with the given environment variables.
 
         Args:
@@ -73,26 +178,21 @@ class EnvProcessor:
         try:
             logger.info(f"Processing template {template_path}")
 
-            # Read template content
-            if not template_path.exists():
-                raise FileNotFoundError(f"Template file not found: {template_path}")
-
-            template_content = template_path.read_text()
+            # Read template content, reusing the template if the file is unchanged
+            try:
+                template_stat = template_path.stat()
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Template file not found: {template_path}") from None
 
-            # Create template and substitute variables
-            template = Template(template_content)
-            processed_content = template.safe_substitute(env_vars)
+            template = _compile_template(str(template_path), template_stat.st_mtime_ns, template_stat.st_size)
 
-            # Check for unsubstituted variables
-            remaining_vars = []
-            for line in processed_content.splitlines():
-                if "${" in line or "$" in line and "}" in line:
-                    remaining_vars.append(line)
+            # Substitute variables, recording the ones left in place
+            tracking_env = _TrackingEnv(env_vars)
+            processed_content = template.safe_substitute(tracking_env)
 
-            if remaining_vars:
-                logger.warning(f"Some variables in {template_path} were not substituted:")
-                for line in remaining_vars:
-                    logger.warning(f"  {line}")
+            if tracking_env.missing:
+                logger.warning(f"Some variables in {template_path} were not substituted: "
+                               f"{', '.join(sorted(tracking_env.missing))}")
 
             return processed_content
 
@@ -103,6 +203,8 @@ class EnvProcessor:
     def write_processed_file(self, content: str, output_path: Path) -> Path:
         """Write processed content to a file with secure permissions.
 
+        A file that already holds the same content is left untouched.
+
         Args:
             content: Processed content to write
             output_path: Path to write the file to
@@ -111,16 +213,33 @@ class EnvProcessor:
             Path to the written file
         """
         try:
+            data = content.encode('utf-8')
+
+            # Most cycles regenerate identical files; the size check avoids
+            # reading files whose content has clearly changed
+            try:
+                if output_path.stat().st_size == len(data) and output_path.read_bytes() == data:
+                    logger.debug("Processed file %s is unchanged", output_path)
+                    return output_path
+                file_exists = True
+            except FileNotFoundError:
+                file_exists = False
+
             logger.info(f"Writing processed file to {output_path}")
 
             # Create parent directory if it doesn't exist
-            self._ensure_directory(output_path.parent)
-
-            # Write content
-            output_path.write_text(content)
+            if not file_exists:
+                self._ensure_directory(output_path.parent)
 
-            # Set secure permissions
-            os.chmod(output_path, stat.S_IRUSR | stat.S_IWUSR)  # 0o600
+            # Write content; the file is created with secure permissions (0o600)
+            # so it is never readable by others, not even briefly
+            try:
+                self._write_private(output_path, data)
+            except FileNotFoundError:
+                # The directory was removed after it was verified
+                self._verified_dirs.discard(str(output_path.parent))
+                self._ensure_directory(output_path.parent)
+                self._write_private(output_path, data)
 
             return output_path
 
@@ -128,17 +247,23 @@ class EnvProcessor:
             logger.error(f"Failed to write processed file to {output_path}: {e}")
             raise
 
+    @staticmethod
+    def _write_private(output_path: Path, data: bytes) -> None:
+        """Write data to a file only its owner can read."""
+        with open(output_path, 'wb', opener=_open_private) as f:
+            f.write(data)
+
     def process_quadlet_file(self,
                              template_path: Path,
                              app_name: str,
-                             env_vars: Dict[str, str],
+                             env_vars: Optional[Mapping[str, str]],
                              output_dir: Optional[Path] = None) -> Path:
         """Process a quadlet template file and write it to the output directory.
 
         Args:
             template_path: Path to the template file
             app_name: Name of the application
-            env_vars: Dictionary of environment variables for substitution
+            env_vars: Environment variables for substitution; not modified
             output_dir: Directory to write the processed file to (default: self.base_dir)
 
         Returns:
@@ -146,8 +271,8 @@ class EnvProcessor:
         """
         try:
             # Add APP_NAME to env vars if not already present
-            if 'APP_NAME' not in env_vars:
-                env_vars['APP_NAME'] = app_name
+            if not env_vars or 'APP_NAME' not in env_vars:
+                env_vars = {**(env_vars or {}), 'APP_NAME': app_name}
 
             # Process the template
             processed_content = self.process_template(template_path, env_vars)
@@ -1,5 +1,6 @@
 import logging
-from typing import Dict, Optional, Set
+import threading
+from typing import Dict, Optional
 from pathlib import Path
 
 from .git_operations import GitOperations
@@ -15,11 +16,25 @@ class GitManager:
         # Map of repository URLs to GitOperations instances
         self.repositories: Dict[str, GitOperations] = {}
 
-        # Track which repositories have been checked this cycle
-        self.checked_repos: Set[str] = set()
+        # Whether each repository checked this cycle has changes
+        self._change_cache: Dict[str, bool] = {}
 
-        # Track which repositories have changes
-        self.repos_with_changes: Set[str] = set()
+        # Applications are processed in parallel; a repository shared by several
+        # of them must only be fetched or pulled by one thread at a time
+        self._lock = threading.Lock()
+        self._repo_locks: Dict[str, threading.RLock] = {}
+
+    def repo_lock(self, repo_url: str) -> threading.RLock:
+        """Get the lock guarding Git operations on a repository.
+
+        Args:
+            repo_url: Repository URL
+
+        Returns:
+            Lock for the repository
+        """
+        with self._lock:
+            return self._repo_locks.setdefault(repo_url, threading.RLock())
 
     def get_git_ops(self, git_config: GitConfig, work_dir: Path) -> GitOperations:
         """Get or create a GitOperations instance for a repository.
@@ -34,11 +49,12 @@ class GitManager:
         repo_url = git_config.repository_url
 
         # Create a new GitOperations instance if one doesn't exist
-        if repo_url not in self.repositories:
-            logger.info(f"Creating new GitOperations for repository: {repo_url}")
-            self.repositories[repo_url] = GitOperations(git_config, work_dir)
+        with self.repo_lock(repo_url):
+            if repo_url not in self.repositories:
+                logger.info(f"Creating new GitOperations for repository: {repo_url}")
+                self.repositories[repo_url] = GitOperations(git_config, work_dir)
 
-        return self.repositories[repo_url]
+            return self.repositories[repo_url]
 
     def check_for_changes(self, git_ops: GitOperations) -> bool:
         """Check if a repository has changes (only once per cycle).
@@ -51,22 +67,25 @@ class GitManager:
         """
         repo_url = git_ops.config.repository_url
 
-        # If we've already checked this repository, return the cached result
-        if repo_url in self.checked_repos:
-            has_changes = repo_url in self.repos_with_changes
-            logger.debug(f"Using cached change status for {repo_url}: {has_changes}")
-            return has_changes
-
-        # Check for changes and cache the result
-        has_changes = git_ops.has_changes()
-        self.checked_repos.add(repo_url)
-
-        if has_changes:
-            self.repos_with_changes.add(repo_url)
+        with self.repo_lock(repo_url):
+            # If we've already checked this repository, return the cached result
+            has_changes = self._change_cache.get(repo_url)
+            if has_changes is not None:
+                logger.debug(f"Using cached change status for {repo_url}: {has_changes}")
+                return has_changes
 
-        return has_changes
+            # Check for changes and cache the result
+            has_changes = git_ops.has_changes()
+            self._change_cache[repo_url] = has_changes
+            return has_changes
 
     def reset_cycle(self):
-        """Reset the cycle tracking."""
-        self.checked_repos.clear()
-        self.repos_with_changes.clear()
\ No newline at end of file
+        """Reset the cycle tracking.
+
+        HEAD commits cached by the repositories are dropped as well, so a
+        checkout changed by hand is picked up once per cycle.
+        """
+        with self._lock:
+            self._change_cache.clear()
+            for git_ops in self.repositories.values():
+                git_ops.invalidate_head_cache()
\ No newline at end of file
@@ -1,19 +1,35 @@
 import logging
 import os
+import re
+import subprocess
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Optional, Set
 from git import Repo, GitCommandError
 from .config import GitConfig
 
 logger = logging.getLogger(__name__)
 
+# Variables printed by `ssh-agent -s`, e.g. "SSH_AUTH_SOCK=/tmp/ssh-x/agent.1; export SSH_AUTH_SOCK;"
+_SSH_AGENT_VAR_RE = re.compile(r'(SSH_AUTH_SOCK|SSH_AGENT_PID)=([^;]+);')
+
 class GitOperations:
     """Handles Git operations for the GitOps workflow."""
 
+    # One ssh-agent is shared by all repositories of the process
+    _agent_lock: ClassVar[threading.Lock] = threading.Lock()
+    _agent_started: ClassVar[bool] = False
+    # Keys already added to the shared agent
+    _agent_keys: ClassVar[Set[str]] = set()
+
     def __init__(self, config: GitConfig, work_dir: Path):
         self.config = config
         self.work_dir = work_dir
         self.repo: Optional[Repo] = None
+        # HEAD commit, cached until an operation here moves HEAD
+        self._head_commit: Optional[str] = None
+        # Repository directories applications deploy from; "" is the whole repository
+        self._checkout_paths: Set[str] = set()
         self._setup_ssh()
 
     def _setup_ssh(self):
@@ -26,21 +42,36 @@ class GitOperations:
             # Set up SSH environment
             os.environ['GIT_SSH_COMMAND'] = f'ssh -i {self.config.ssh_key_path} -o StrictHostKeyChecking=no'
             
-            # If key has password, set up ssh-agent
+            # If key has password, add it to the shared ssh-agent
             if self.config.ssh_key_password:
-                import subprocess
-                try:
-                    # Start ssh-agent
-                    subprocess.run(['ssh-agent', '-s'], check=True)
-                    # Add key to ssh-agent
-                    subprocess.run(
-                        ['ssh-add', str(self.config.ssh_key_path)],
-                        input=self.config.ssh_key_password.encode(),
-                        check=True
-                    )
-                except subprocess.SubprocessError as e:
-                    logger.error(f"Failed to set up ssh-agent: {e}")
-                    raise
+                key_path = str(self.config.ssh_key_path)
+                with GitOperations._agent_lock:
+                    if key_path in GitOperations._agent_keys:
+                        return
+                    try:
+                        if not GitOperations._agent_started:
+                            self._start_ssh_agent()
+                        # Add key to ssh-agent
+                        subprocess.run(
+                            ['ssh-add', key_path],
+                            input=self.config.ssh_key_password.encode(),
+                            check=True
+                        )
+                        GitOperations._agent_keys.add(key_path)
+                    except subprocess.SubprocessError as e:
+                        logger.error(f"Failed to set up ssh-agent: {e}")
+                        raise
+
+    @staticmethod
+    def _start_ssh_agent() -> None:
+        """Start an ssh-agent and export its socket so ssh-add and Git can reach it."""
+        result = subprocess.run(['ssh-agent', '-s'], capture_output=True, text=True, check=True)
+        agent_vars = dict(_SSH_AGENT_VAR_RE.findall(result.stdout))
+        if 'SSH_AUTH_SOCK' not in agent_vars:
+            raise subprocess.SubprocessError(f"Unexpected ssh-agent output: {result.stdout.strip()}")
+        os.environ.update(agent_vars)
+        GitOperations._agent_started = True
+        logger.info(f"Started ssh-agent (pid {agent_vars.get('SSH_AGENT_PID', 'unknown')})")
 
     def clone_repository(self) -> bool:
         """Clone the repository if it doesn't exist."""
@@ -53,37 +84,120 @@ class GitOperations:
             
             if not (repo_dir / '.git').exists():
                 logger.info(f"Cloning repository {self.config.repository_url}")
+                self._head_commit = None
+                clone_options = {'depth': 1, 'single_branch': True} if self.config.shallow else {}
+                sparse = self._use_sparse_checkout()
+                if sparse:
+                    # Download file contents only for the directories checked out below
+                    clone_options.update({'filter': 'blob:none', 'no_checkout': True})
                 self.repo = Repo.clone_from(
                     self.config.repository_url,
                     repo_dir,
-                    branch=self.config.branch
+                    branch=self.config.branch,
+                    **clone_options
                 )
+                if sparse:
+                    logger.info(f"Checking out {', '.join(sorted(self._checkout_paths))} only")
+                    self.repo.git.sparse_checkout('set', '--cone', *sorted(self._checkout_paths))
+                    self.repo.git.checkout(self.config.branch)
                 return True
             return False
         except GitCommandError as e:
             logger.error(f"Failed to clone repository: {e}")
             raise
 
+    def _use_sparse_checkout(self) -> bool:
+        """Whether a new clone should check out only the requested directories."""
+        return self.config.sparse_checkout and bool(self._checkout_paths) and "" not in self._checkout_paths
+
+    def include_path(self, path: str) -> None:
+        """Make sure a directory of the repository is present in the checkout.
+
+        Call this for every directory an application deploys from before the
+        repository is cloned. A sparse checkout made by an earlier clone is
+        widened to include directories requested later.
+
+        Args:
+            path: Directory relative to the repository root
+        """
+        path = path.strip("/")
+        if path == ".":
+            path = ""
+        if not self.config.sparse_checkout or path in self._checkout_paths:
+            return
+        self._checkout_paths.add(path)
+
+        repo_dir = self.config.repo_dir or self.work_dir
+        if not (repo_dir / '.git').exists():
+            return
+
+        if not self.repo:
+            self.repo = Repo(repo_dir)
+
+        try:
+            # Leave full checkouts made without sparse checkout alone
+            if self.repo.git.config('--get', '--type=bool', 'core.sparseCheckout', with_exceptions=False) != 'true':
+                return
+
+            if path:
+                logger.info(f"Adding {path} to the sparse checkout")
+                self.repo.git.sparse_checkout('add', path)
+            else:
+                logger.info("Checking out the whole repository")
+                self.repo.git.sparse_checkout('disable')
+        except GitCommandError as e:
+            logger.error(f"Failed to update the sparse checkout: {e}")
+            raise
+
     def pull_changes(self) -> bool:
-        """Pull latest changes from the repository."""
+        """Pull latest changes from the repository.
+
+        With shallow enabled the checkout is reset to the remote branch tip,
+        which discards local commits and uncommitted changes instead of
+        merging them.
+        """
         try:
             if not self.repo:
                 repo_dir = self.config.repo_dir or self.work_dir
                 self.repo = Repo(repo_dir)
-            
-            logger.info("Pulling latest changes")
-            self.repo.remotes.origin.pull()
+
+            # HEAD moves on success and may have moved if the pull failed halfway
+            self._head_commit = None
+
+            if self.config.shallow:
+                # Only the tip commit is needed to deploy, so fetch it alone and move
+                # the checkout onto it instead of merging history
+                logger.info("Fetching latest commit")
+                self._fetch_tip()
+                self.repo.git.reset('--hard', f"origin/{self.config.branch}")
+            else:
+                logger.info("Pulling latest changes")
+                self.repo.remotes.origin.pull()
             return True
         except GitCommandError as e:
             logger.error(f"Failed to pull changes: {e}")
             raise
 
+    def _fetch_tip(self) -> None:
+        """Fetch only the tip commit of the tracked branch into its remote-tracking ref."""
+        branch = self.config.branch
+        self.repo.remotes.origin.fetch(f"+refs/heads/{branch}:refs/remotes/origin/{branch}", depth=1)
+
     def get_current_commit(self) -> str:
-        """Get the current commit hash."""
-        if not self.repo:
-            repo_dir = self.config.repo_dir or self.work_dir
-            self.repo = Repo(repo_dir)
-        return self.repo.head.commit.hexsha
+        """Get the current commit hash.
+
+        The hash is cached until the next clone, pull or checkout.
+        """
+        if self._head_commit is None:
+            if not self.repo:
+                repo_dir = self.config.repo_dir or self.work_dir
+                self.repo = Repo(repo_dir)
+            self._head_commit = self.repo.head.commit.hexsha
+        return self._head_commit
+
+    def invalidate_head_cache(self) -> None:
+        """Forget the cached HEAD commit, e.g. in case the checkout was changed outside this process."""
+        self._head_commit = None
 
     def checkout_branch(self, branch: str) -> bool:
         """Checkout a specific branch."""
@@ -93,12 +207,30 @@ class GitOperations:
                 self.repo = Repo(repo_dir)
             
             logger.info(f"Checking out branch {branch}")
+            self._head_commit = None
             self.repo.git.checkout(branch)
             return True
         except GitCommandError as e:
             logger.error(f"Failed to checkout branch: {e}")
             raise
 
+    def peek_remote_head(self) -> Optional[str]:
+        """Get the commit the tracked branch points to on the remote, without fetching.
+
+        Returns:
+            Commit hash, or None if it could not be determined
+        """
+        try:
+            if not self.repo:
+                repo_dir = self.config.repo_dir or self.work_dir
+                self.repo = Repo(repo_dir)
+
+            output = self.repo.git.ls_remote('--exit-code', 'origin', f"refs/heads/{self.config.branch}")
+            return output.split()[0] if output else None
+        except GitCommandError as e:
+            logger.warning(f"Failed to read remote branch head: {e}")
+            return None
+
     def has_changes(self) -> bool:
         """Check if there are any changes in the remote repository.
 
@@ -110,12 +242,26 @@ class GitOperations:
                 repo_dir = self.config.repo_dir or self.work_dir
                 self.repo = Repo(repo_dir)
 
-            # Fetch from remote to update refs
+            # Comparing the remote branch tip with HEAD needs no object transfer;
+            # pull_changes fetches the objects when there is something to deploy
+            remote_head = self.peek_remote_head()
+            if remote_head is not None:
+                local_commit = self.get_current_commit()
+                if remote_head == local_commit:
+                    logger.info("No changes detected in remote repository")
+                    return False
+                logger.info(f"Remote changes detected (local: {local_commit[:8]}, remote: {remote_head[:8]})")
+                return True
+
+            # The remote head could not be read, so fetch to update refs
             logger.info("Fetching from remote to check for changes")
-            self.repo.remotes.origin.fetch()
+            if self.config.shallow:
+                self._fetch_tip()
+            else:
+                self.repo.remotes.origin.fetch()
 
             # Get current and remote commit hashes
-            local_commit = self.repo.head.commit.hexsha
+            local_commit = self.get_current_commit()
             remote_branch = f"origin/{self.config.branch}"
             remote_commit = self.repo.refs[remote_branch].commit.hexsha
 
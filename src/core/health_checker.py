@@ -1,21 +1,55 @@
 import logging
+import os
 import socket
 import subprocess
+import tempfile
 import time
 import httpx
 import json
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Optional, Tuple, List, Any
+from urllib.parse import quote
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of containers probed concurrently
+MAX_HEALTH_CHECK_WORKERS = 32
+
+# Seconds between re-checks of containers that are waited on without events
+EVENT_RECHECK_INTERVAL = 5.0
+
+# Bytes read from podman logs at a time
+LOG_READ_CHUNK_SIZE = 64 * 1024
+
+# Podman REST API version used on the service socket
+PODMAN_API_VERSION = "v4.0.0"
+
+def default_podman_socket() -> Path:
+    """Get the socket of the rootless Podman API service (podman.socket)."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or f"/run/user/{os.getuid()}"
+    return Path(runtime_dir) / "podman" / "podman.sock"
+
 class HealthChecker:
     """Basic health checker for containers."""
 
-    def __init__(self):
-        """Initialize the health checker."""
+    def __init__(self, cache_ttl: float = 2.0, podman_socket: Optional[Path] = None):
+        """Initialize the health checker.
+
+        Args:
+            cache_ttl: Seconds a health check result is reused before podman is queried again
+            podman_socket: Socket of the Podman API service; defaults to the
+                rootless user socket. Containers are inspected over it when it
+                exists, and with the podman CLI otherwise.
+        """
         self._ensure_podman()
         self._client = httpx.Client(timeout=1.0)
+        self._api = self._connect_api(podman_socket or default_podman_socket())
+        self.cache_ttl = cache_ttl
+        # Map of container names to (timestamp, health result)
+        self._health_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
         logger.info("Health checker initialized")
 
     def _ensure_podman(self):
@@ -27,83 +61,120 @@ class HealthChecker:
             logger.error("Podman is not available: %s", e)
             raise RuntimeError("Podman is not installed or not accessible")
 
-    def _get_container_ports(self, container_name: str) -> Dict[str, int]:
-        """Get the exposed ports of a container."""
-        try:
-            logger.debug(f"Getting ports for container {container_name}")
+    @staticmethod
+    def _connect_api(podman_socket: Path) -> Optional[httpx.Client]:
+        """Create a client for the Podman API service if its socket exists.
 
-            # Try a different format string that directly gives us the port mappings
-            result = subprocess.run(
-                ["podman", "inspect", "--format", "{{json .HostConfig.PortBindings}}", container_name],
-                capture_output=True,
-                text=True,
-                check=False
-            )
+        Args:
+            podman_socket: Path of the API socket
 
-            if result.returncode == 0 and result.stdout.strip():
-                try:
-                    # Parse the JSON output
-                    import json
-                    port_bindings = json.loads(result.stdout.strip())
-
-                    ports = {}
-                    for port_key, bindings in port_bindings.items():
-                        # Format is usually like "8080/tcp"
-                        port_str = port_key.split('/')[0]
-
-                        # Each binding is a list of objects with HostIP and HostPort
-                        for binding in bindings:
-                            host_port = binding.get('HostPort')
-                            if host_port and host_port.isdigit():
-                                ports[port_str] = int(host_port)
-
-                    logger.debug(f"Parsed ports for {container_name} from JSON: {ports}")
-                    return ports
-                except json.JSONDecodeError:
-                    logger.warning(f"Failed to parse JSON port bindings: {result.stdout}")
-                    # Fall back to the original method
-
-            # If JSON approach failed, try an alternative method by getting exposed ports
-            result = subprocess.run(
-                ["podman", "container", "port", container_name],
-                capture_output=True,
-                text=True,
-                check=False
-            )
+        Returns:
+            Client keeping a connection to the socket open, or None
+        """
+        if not podman_socket.is_socket():
+            logger.debug(f"Podman API socket {podman_socket} not found, using the podman CLI")
+            return None
 
-            ports = {}
-            if result.returncode == 0 and result.stdout.strip():
-                # Output format: 8080/tcp -> 0.0.0.0:8080
-                for line in result.stdout.strip().split('\n'):
-                    parts = line.split(' -> ')
-                    if len(parts) == 2:
-                        container_port = parts[0].split('/')[0]  # Get "8080" from "8080/tcp"
-                        host_part = parts[1]  # Get "0.0.0.0:8080"
-
-                        if ':' in host_part:
-                            host_port = host_part.split(':')[1]
-                            if host_port.isdigit():
-                                ports[container_port] = int(host_port)
-
-                logger.debug(f"Parsed ports for {container_name} using port command: {ports}")
-                return ports
-
-            logger.warning(f"No port bindings found for container {container_name}")
-            return {}
-        except Exception as e:
-            logger.error(f"Failed to get container ports: {e}")
+        logger.info(f"Using Podman API socket {podman_socket}")
+        return httpx.Client(
+            transport=httpx.HTTPTransport(uds=str(podman_socket)),
+            base_url=f"http://podman/{PODMAN_API_VERSION}/libpod",
+            timeout=10.0
+        )
+
+    def _inspect_containers_api(self, container_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Inspect containers over the Podman API socket.
+
+        Args:
+            container_names: Names (or IDs) of the containers
+
+        Returns:
+            Dictionary of container names and their inspect data; containers
+            that do not exist are left out
+        """
+        inspected = {}
+        for container_name in container_names:
+            response = self._api.get(f"/containers/{quote(container_name, safe='')}/json")
+            if response.status_code == 404:
+                continue
+            response.raise_for_status()
+            inspected[container_name] = response.json()
+        return inspected
+
+    def _inspect_containers(self, container_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Inspect several containers with a single podman call.
+
+        Uses the Podman API socket when available, which avoids starting a
+        podman process; falls back to the CLI if the API fails.
+
+        Args:
+            container_names: Names (or IDs) of the containers
+
+        Returns:
+            Dictionary of container names and their inspect data; containers
+            that do not exist are left out
+        """
+        logger.debug("Inspecting containers: %s", container_names)
+        if self._api is not None:
+            try:
+                return self._inspect_containers_api(container_names)
+            except httpx.HTTPError as e:
+                logger.warning(f"Podman API request failed, using the podman CLI: {e}")
+
+        result = subprocess.run(
+            ["podman", "container", "inspect", *container_names],
+            capture_output=True,
+            text=True,
+            check=False
+        )
+
+        # podman fails if any container is missing but still prints the others
+        if result.returncode != 0:
+            logger.warning(f"Failed to inspect some containers: {result.stderr.strip()}")
+
+        try:
+            entries = json.loads(result.stdout) if result.stdout.strip() else []
+        except json.JSONDecodeError:
+            logger.warning(f"Failed to parse podman inspect output: {result.stdout[:200]}")
             return {}
 
+        inspected = {}
+        for container_name in container_names:
+            for entry in entries or []:
+                if entry.get("Name") == container_name or entry.get("Id", "").startswith(container_name):
+                    inspected[container_name] = entry
+                    break
+        return inspected
+
+    @staticmethod
+    def _ports_from_inspect(container_info: Dict[str, Any]) -> Dict[str, int]:
+        """Get the published host ports of a container from its inspect data."""
+        port_bindings = ((container_info.get("HostConfig") or {}).get("PortBindings")
+                         or (container_info.get("NetworkSettings") or {}).get("Ports")
+                         or {})
+
+        ports = {}
+        for port_key, bindings in port_bindings.items():
+            # Format is usually like "8080/tcp"
+            port_str = port_key.split('/')[0]
+
+            # Each binding is a list of objects with HostIp and HostPort
+            for binding in bindings or []:
+                host_port = binding.get('HostPort')
+                if host_port and host_port.isdigit():
+                    ports[port_str] = int(host_port)
+        return ports
+
     def _check_tcp_port(self, host: str, port: int, timeout: float = 1.0) -> bool:
         """Check if a TCP port is open."""
         try:
-            logger.debug(f"Checking TCP port {port} on {host}")
+            logger.debug("Checking TCP port %s on %s", port, host)
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.settimeout(timeout)
             result = sock.connect_ex((host, port))
             sock.close()
             is_open = result == 0
-            logger.debug(f"TCP port {port} on {host} is {'open' if is_open else 'closed'}")
+            logger.debug("TCP port %s on %s is %s", port, host, 'open' if is_open else 'closed')
             return is_open
         except Exception as e:
             logger.error(f"Failed to check TCP port {port}: {e}")
@@ -112,38 +183,100 @@ class HealthChecker:
     def _check_http_status(self, url: str, timeout: float = 1.0) -> bool:
         """Check if an HTTP endpoint returns 200."""
         try:
-            logger.debug(f"Checking HTTP status for {url}")
+            logger.debug("Checking HTTP status for %s", url)
             response = self._client.get(url, timeout=timeout)
             is_ok = response.status_code == 200
-            logger.debug(f"HTTP status for {url}: {response.status_code} (ok: {is_ok})")
+            logger.debug("HTTP status for %s: %s (ok: %s)", url, response.status_code, is_ok)
             return is_ok
         except Exception as e:
             logger.error(f"Failed to check HTTP status for {url}: {e}")
             return False
 
-    def check_container_health(self, container_name: str) -> Dict[str, Any]:
-        """Check the health of a container."""
-        try:
-            logger.info(f"Checking health for container: {container_name}")
+    def invalidate_health_cache(self, container_name: Optional[str] = None) -> None:
+        """Drop cached health results.
+
+        Args:
+            container_name: Container to invalidate (None for all containers)
+        """
+        if container_name is None:
+            self._health_cache.clear()
+        else:
+            self._health_cache.pop(container_name, None)
+
+    def check_container_health(self, container_name: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Check the health of a container.
+
+        Args:
+            container_name: Name of the container
+            use_cache: Return a cached result if it is younger than cache_ttl
+
+        Returns:
+            Dictionary with health status details
+        """
+        return self.check_many([container_name], use_cache=use_cache)[container_name]
+
+    def check_many(self, container_names: List[str], use_cache: bool = True) -> Dict[str, Dict[str, Any]]:
+        """Check the health of several containers with a single podman query.
+
+        Args:
+            container_names: Names of the containers
+            use_cache: Return cached results that are younger than cache_ttl
+
+        Returns:
+            Dictionary of container names and their health status details
+        """
+        results = {}
+        to_inspect = []
+        now = time.monotonic()
+        for container_name in container_names:
+            cached = self._health_cache.get(container_name) if use_cache else None
+            if cached and now - cached[0] < self.cache_ttl:
+                logger.debug("Using cached health result for container: %s", container_name)
+                results[container_name] = cached[1]
+            else:
+                to_inspect.append(container_name)
 
-            # Get container state
-            state_result = subprocess.run(
-                ["podman", "inspect", "--format", "{{.State.Status}}", container_name],
-                capture_output=True,
-                text=True,
-                check=False
-            )
+        if not to_inspect:
+            return results
+
+        try:
+            inspected = self._inspect_containers(to_inspect)
+        except Exception as e:
+            logger.error(f"Failed to inspect containers: {e}", exc_info=True)
+            error = {"status": "error", "state": "error", "error": str(e), "healthy": False}
+            results.update({container_name: dict(error) for container_name in to_inspect})
+            return results
+
+        def check(container_name: str) -> Dict[str, Any]:
+            return self._health_from_inspect(container_name, inspected.get(container_name))
+
+        if len(to_inspect) == 1:
+            health_results = [check(to_inspect[0])]
+        else:
+            # Port probes are independent socket/HTTP checks, so run them concurrently
+            with ThreadPoolExecutor(max_workers=min(MAX_HEALTH_CHECK_WORKERS, len(to_inspect))) as executor:
+                health_results = list(executor.map(check, to_inspect))
+
+        for container_name, health_status in zip(to_inspect, health_results):
+            self._health_cache[container_name] = (time.monotonic(), health_status)
+            results[container_name] = health_status
+        return results
+
+    def _health_from_inspect(self, container_name: str, container_info: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Determine the health of a container from its inspect data and port probes."""
+        try:
+            logger.info("Checking health for container: %s", container_name)
 
-            if state_result.returncode != 0:
-                logger.warning(f"Failed to inspect container {container_name}: {state_result.stderr}")
+            if container_info is None:
+                logger.warning(f"Failed to inspect container {container_name}")
                 return {
                     "status": "not_found",
                     "state": "unknown",
                     "healthy": False
                 }
 
-            state = state_result.stdout.strip()
-            logger.info(f"Container {container_name} state: {state}")
+            state = (container_info.get("State") or {}).get("Status", "unknown")
+            logger.info("Container %s state: %s", container_name, state)
 
             # Check if container is running
             if state != "running":
@@ -155,22 +288,15 @@ class HealthChecker:
                 }
 
             # Get container ports
-            ports = self._get_container_ports(container_name)
+            ports = self._ports_from_inspect(container_info)
             if not ports:
                 logger.warning(f"No TCP ports found for container {container_name}")
 
                 # Check if the container has any exposed ports in its configuration
-                exposed_ports_result = subprocess.run(
-                    ["podman", "inspect", "--format", "{{.Config.ExposedPorts}}", container_name],
-                    capture_output=True,
-                    text=True,
-                    check=False
-                )
-
-                exposed_ports = exposed_ports_result.stdout.strip()
-                logger.info(f"Container {container_name} exposed ports: {exposed_ports}")
+                exposed_ports = (container_info.get("Config") or {}).get("ExposedPorts")
+                logger.info("Container %s exposed ports: %s", container_name, exposed_ports)
 
-                if exposed_ports == "map[]" or not exposed_ports:
+                if not exposed_ports:
                     logger.info(f"Container {container_name} has no exposed ports, assuming it's healthy")
                     return {
                         "status": "running_no_ports",
@@ -190,7 +316,7 @@ class HealthChecker:
             for port in ports.values():
                 port_checks[port] = self._check_tcp_port("localhost", port)
 
-            logger.info(f"TCP port checks for {container_name}: {port_checks}")
+            logger.info("TCP port checks for %s: %s", container_name, port_checks)
 
             if not any(port_checks.values()):
                 logger.warning(f"No open TCP ports found for container {container_name}")
@@ -207,7 +333,7 @@ class HealthChecker:
             for port in ports.values():
                 if port_checks.get(port, False):
                     try:
-                        logger.debug(f"Attempting HTTP check on port {port}")
+                        logger.debug("Attempting HTTP check on port %s", port)
                         http_healthy = self._check_http_status(f"http://localhost:{port}")
                         if http_healthy:
                             logger.info(f"HTTP check successful on port {port}")
@@ -227,7 +353,7 @@ class HealthChecker:
                 "healthy": healthy
             }
 
-            logger.info(f"Health check result for {container_name}: {health_status}")
+            logger.info("Health check result for %s: %s", container_name, health_status)
             return health_status
 
         except Exception as e:
@@ -241,38 +367,134 @@ class HealthChecker:
 
     def wait_for_healthy(self, container_name: str, timeout: int = 30) -> bool:
         """Wait for a container to become healthy."""
-        logger.info(f"Waiting for container {container_name} to become healthy (timeout: {timeout}s)")
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            health = self.check_container_health(container_name)
-            if health["healthy"]:
-                logger.info(f"Container {container_name} is healthy after {int(time.time() - start_time)}s")
-                return True
-
-            # Log progress
-            elapsed = int(time.time() - start_time)
-            logger.debug(f"Container {container_name} is not yet healthy after {elapsed}s, current state: {health['state']}")
-
-            time.sleep(1)
+        return self.wait_for_many_healthy([container_name], timeout=timeout)[container_name]
+
+    def wait_for_many_healthy(self, container_names: List[str], timeout: float = 30) -> Dict[str, bool]:
+        """Wait for several containers to become healthy.
+
+        Instead of polling every container each second, a single podman events
+        stream is watched and a container is only checked again when podman
+        reports an event for it. Opening ports produces no events, so pending
+        containers are also re-checked every EVENT_RECHECK_INTERVAL seconds.
+
+        Args:
+            container_names: Names of the containers
+            timeout: Seconds to wait for all containers
+
+        Returns:
+            Dictionary of container names and whether they became healthy
+        """
+        logger.info(f"Waiting for containers {container_names} to become healthy (timeout: {timeout}s)")
+        start_time = time.monotonic()
+        deadline = start_time + timeout
+
+        health = self.check_many(container_names)
+        pending = {name for name, health_data in health.items() if not health_data["healthy"]}
+
+        events = None
+        if pending:
+            changed = queue.Queue()
+            try:
+                events = subprocess.Popen(
+                    ["podman", "events", "--format", "json", "--filter", "type=container"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True
+                )
+                threading.Thread(target=self._watch_events, args=(events.stdout, changed), daemon=True).start()
+            except OSError as e:
+                logger.warning(f"Could not watch podman events, re-checking periodically instead: {e}")
 
-        logger.warning(f"Container {container_name} did not become healthy within {timeout}s")
-        return False
+        try:
+            next_recheck = time.monotonic() + EVENT_RECHECK_INTERVAL
+            while pending:
+                now = time.monotonic()
+                if now >= deadline:
+                    break
 
-    def get_container_logs(self, container_name: str, lines: int = 50) -> Optional[str]:
-        """Get recent logs from a container."""
+                to_check = set()
+                try:
+                    to_check.add(changed.get(timeout=min(deadline, next_recheck) - now))
+                    while True:
+                        to_check.add(changed.get_nowait())
+                except queue.Empty:
+                    pass
+
+                if time.monotonic() >= next_recheck:
+                    to_check = set(pending)
+                    next_recheck = time.monotonic() + EVENT_RECHECK_INTERVAL
+
+                to_check &= pending
+                if not to_check:
+                    continue
+
+                health = self.check_many(sorted(to_check), use_cache=False)
+                for name, health_data in health.items():
+                    if health_data["healthy"]:
+                        logger.info(f"Container {name} is healthy after {int(time.monotonic() - start_time)}s")
+                        pending.discard(name)
+                    else:
+                        logger.debug("Container %s is not yet healthy, current state: %s", name, health_data['state'])
+        finally:
+            if events is not None:
+                events.terminate()
+                try:
+                    events.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    events.kill()
+
+        for name in pending:
+            logger.warning(f"Container {name} did not become healthy within {timeout}s")
+        return {name: name not in pending for name in container_names}
+
+    @staticmethod
+    def _watch_events(stream, changed: "queue.Queue[str]") -> None:
+        """Put the name of every container podman reports an event for on a queue."""
+        for line in stream:
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if event.get("Name"):
+                changed.put(event["Name"])
+
+    def get_container_logs(self, container_name: str, lines: int = 50,
+                           max_bytes: Optional[int] = None) -> Optional[str]:
+        """Get recent logs from a container.
+
+        Args:
+            container_name: Name of the container
+            lines: Number of log lines to request from podman
+            max_bytes: Keep at most this many trailing bytes of the output;
+                the rest is discarded while reading
+
+        Returns:
+            The logs, or None if they could not be retrieved
+        """
         try:
             logger.info(f"Getting logs for container {container_name}")
-            result = subprocess.run(
-                ["podman", "logs", "--tail", str(lines), container_name],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            if result.returncode == 0:
-                logger.debug(f"Successfully retrieved {lines} lines of logs for {container_name}")
-                return result.stdout
-            else:
-                logger.error(f"Failed to get logs for {container_name}: {result.stderr}")
+            # stderr goes to a file so a chatty container cannot block the stdout reader
+            with tempfile.TemporaryFile() as stderr:
+                process = subprocess.Popen(
+                    ["podman", "logs", "--tail", str(lines), container_name],
+                    stdout=subprocess.PIPE,
+                    stderr=stderr
+                )
+                with process.stdout:
+                    tail = bytearray()
+                    for chunk in iter(lambda: process.stdout.read(LOG_READ_CHUNK_SIZE), b""):
+                        tail += chunk
+                        if max_bytes is not None and len(tail) > max_bytes:
+                            del tail[:-max_bytes]
+                returncode = process.wait()
+
+                if returncode == 0:
+                    logger.debug(f"Successfully retrieved {lines} lines of logs for {container_name}")
+                    return tail.decode(errors="replace")
+
+                stderr.seek(0)
+                error = stderr.read(LOG_READ_CHUNK_SIZE).decode(errors="replace")
+                logger.error(f"Failed to get logs for {container_name}: {error}")
                 return None
         except Exception as e:
             logger.error(f"Failed to get container logs: {e}")
@@ -317,9 +539,14 @@ class HealthChecker:
             containers = [line.strip() for line in result.stdout.splitlines() if line.strip()]
             logger.info(f"Found {len(containers)} containers")
 
+            if not containers:
+                return []
+
+            # One podman query for all containers
+            health_results = self.check_many(containers)
+
             container_status = []
-            for container in containers:
-                health = self.check_container_health(container)
+            for container, health in health_results.items():
                 container_status.append({
                     "name": container,
                     "state": health.get("state", "unknown"),
@@ -1,19 +1,36 @@
 import logging
 import logging.handlers
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
+
+# Arguments of the last setup_logging call, so repeated calls are a no-op
+_LOGGING_CONFIGURED: Optional[Tuple[Path, str, bool]] = None
 
 def setup_logging(
     log_dir: Path,
     log_level: str = "INFO",
     max_bytes: int = 10 * 1024 * 1024,  # 10MB
-    backup_count: int = 5
+    backup_count: int = 5,
+    log_to_file: bool = True
 ) -> None:
-    """Set up logging with rotation."""
-    
-    # Create log directory if it doesn't exist
-    log_dir.mkdir(parents=True, exist_ok=True)
-    
+    """Set up logging with rotation.
+
+    Calling this again with the same log directory, level and file logging
+    setting leaves the existing handlers in place.
+
+    Args:
+        log_dir: Directory for the log files
+        log_level: Log level for the root and component loggers
+        max_bytes: Maximum size of a log file before it is rotated
+        backup_count: Number of rotated log files to keep
+        log_to_file: Whether to write log files; read-only commands only log
+            to the console
+    """
+    global _LOGGING_CONFIGURED
+    settings = (log_dir, log_level, log_to_file)
+    if _LOGGING_CONFIGURED == settings:
+        return
+
     # Set up root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
@@ -21,7 +38,24 @@ def setup_logging(
     # Remove existing handlers
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+        handler.close()
     
+    # Set up component-specific loggers
+    components = [
+        "git_operations",
+        "quadlet_handler",
+        "systemd_manager",
+        "health_checker",
+        "state_manager"
+    ]
+
+    for component in components:
+        logger = logging.getLogger(f"src.core.{component}")
+        logger.setLevel(log_level)
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
+
     # Create formatters
     file_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -30,41 +64,35 @@ def setup_logging(
         '%(asctime)s - %(levelname)s: %(message)s'
     )
     
-    # Set up file handler with rotation
-    file_handler = logging.handlers.RotatingFileHandler(
-        log_dir / "podman-gitops.log",
-        maxBytes=max_bytes,
-        backupCount=backup_count
-    )
-    file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(file_handler)
-    
     # Set up console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(console_formatter)
     root_logger.addHandler(console_handler)
-    
-    # Set up component-specific loggers
-    components = [
-        "git_operations",
-        "quadlet_handler",
-        "systemd_manager",
-        "health_checker",
-        "state_manager"
-    ]
-    
-    for component in components:
-        logger = logging.getLogger(f"src.core.{component}")
-        logger.setLevel(log_level)
-        
-        # Add component-specific file handler
-        component_handler = logging.handlers.RotatingFileHandler(
-            log_dir / f"{component}.log",
+
+    if log_to_file:
+        # Create log directory if it doesn't exist
+        log_dir.mkdir(parents=True, exist_ok=True)
+
+        # Set up file handler with rotation
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_dir / "podman-gitops.log",
             maxBytes=max_bytes,
             backupCount=backup_count
         )
-        component_handler.setFormatter(file_formatter)
-        logger.addHandler(component_handler)
+        file_handler.setFormatter(file_formatter)
+        root_logger.addHandler(file_handler)
+
+        # Add component-specific file handlers
+        for component in components:
+            component_handler = logging.handlers.RotatingFileHandler(
+                log_dir / f"{component}.log",
+                maxBytes=max_bytes,
+                backupCount=backup_count
+            )
+            component_handler.setFormatter(file_formatter)
+            logging.getLogger(f"src.core.{component}").addHandler(component_handler)
+
+    _LOGGING_CONFIGURED = settings
 
 def get_logger(name: str) -> logging.Logger:
     """Get a logger for a specific component."""
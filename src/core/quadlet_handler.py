@@ -1,14 +1,38 @@
+import filecmp
+import fnmatch
+import hashlib
 import logging
 import os
 import shutil
 from pathlib import Path
-from typing import List, Optional, Dict, Set, Tuple
+from typing import List, Mapping, Optional, Dict, Set, Tuple
 from pydantic import BaseModel
 
 from .env_processor import EnvProcessor
 
 logger = logging.getLogger(__name__)
 
+# Deployment order of file types: dependencies (networks, volumes, images) before
+# the containers that use them, configuration files last
+PROCESSING_ORDER = ('network', 'volume', 'image', 'container', 'config')
+
+def file_sha256(path: Path) -> str:
+    """Compute the SHA-256 hex digest of a file without loading it into memory.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Hex digest of the file content
+    """
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(64 * 1024), b''):
+            digest.update(chunk)
+        return digest.hexdigest()
+
 class QuadletFile(BaseModel):
     """Represents a quadlet file configuration."""
     name: str
@@ -27,6 +51,9 @@ class QuadletHandler:
         'volume': '.volume'
     }
 
+    # Reverse lookup of QUADLET_TYPES for constant-time type dispatch
+    TYPE_BY_EXTENSION = {extension: file_type for file_type, extension in QUADLET_TYPES.items()}
+
     # Define additional configuration file patterns
     CONFIG_PATTERNS = [
         'settings.json',
@@ -40,17 +67,20 @@ class QuadletHandler:
     def __init__(self,
                  systemd_dir: Path,
                  processed_dir: Optional[Path] = None,
-                 systemd_manager=None):
+                 systemd_manager=None,
+                 state_manager=None):
         """Initialize the quadlet handler.
 
         Args:
             systemd_dir: Directory where processed quadlet files should be placed
             processed_dir: Directory for storing processed files before deployment
             systemd_manager: SystemdManager instance for interacting with systemd
+            state_manager: Optional StateManager used to remember digests of deployed files
         """
         self.systemd_dir = Path(os.path.expanduser(str(systemd_dir)))
         self.processed_dir = processed_dir or Path.home() / ".local/lib/podman-gitops/processed"
         self.systemd_manager = systemd_manager
+        self.state_manager = state_manager
         self.env_processor = EnvProcessor(self.processed_dir)
 
         # Ensure directories exist
@@ -70,11 +100,7 @@ class QuadletHandler:
 
     def _get_file_type(self, file_path: Path) -> str:
         """Determine the type of file based on its extension."""
-        suffix = file_path.suffix
-        for file_type, extension in self.QUADLET_TYPES.items():
-            if suffix == extension:
-                return file_type
-        return 'config'
+        return self.TYPE_BY_EXTENSION.get(file_path.suffix, 'config')
 
     def find_quadlet_files(self, directory: Path) -> List[Path]:
         """Find all quadlet and configuration files in the given directory."""
@@ -88,15 +114,22 @@ class QuadletHandler:
         # Convert to absolute path and expand user
         directory = Path(os.path.expanduser(str(directory)))
 
-        # Find all quadlet files
-        quadlet_files = []
-        for extension in self.QUADLET_TYPES.values():
-            quadlet_files.extend(directory.glob(f"*{extension}"))
-
-        # Find configuration files
+        # Single directory pass: bucket quadlet files by extension (in QUADLET_TYPES
+        # order) and match everything else against the config patterns
+        quadlet_by_ext = {extension: [] for extension in self.QUADLET_TYPES.values()}
         config_files = []
-        for pattern in self.CONFIG_PATTERNS:
-            config_files.extend(directory.glob(pattern))
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                name = entry.name
+                bucket = quadlet_by_ext.get(os.path.splitext(name)[1])
+                if bucket is not None:
+                    bucket.append(Path(entry.path))
+                elif any(fnmatch.fnmatchcase(name, pattern) for pattern in self.CONFIG_PATTERNS):
+                    config_files.append(Path(entry.path))
+
+        quadlet_files = [path for paths in quadlet_by_ext.values() for path in paths]
 
         all_files = quadlet_files + config_files
         logger.info(f"Found {len(all_files)} files: {[f.name for f in all_files]}")
@@ -132,7 +165,7 @@ class QuadletHandler:
     def process_and_deploy_app_quadlets(self,
                                         app_name: str,
                                         quadlet_dir: Path,
-                                        env_vars: Optional[Dict[str, str]] = None) -> Tuple[bool, List[str]]:
+                                        env_vars: Optional[Mapping[str, str]] = None) -> Tuple[bool, Tuple[str, ...]]:
         """Process all quadlet files for an application and deploy them.
 
         Args:
@@ -141,7 +174,7 @@ class QuadletHandler:
             env_vars: Environment variables for template substitution
 
         Returns:
-            (success, deployed_services): Tuple of success status and list of deployed service names
+            (success, deployed_services): Tuple of success status and deployed service names
         """
         try:
             logger.info(f"Processing quadlet files for application {app_name}")
@@ -150,65 +183,65 @@ class QuadletHandler:
             quadlet_files = self.find_quadlet_files(quadlet_dir)
             if not quadlet_files:
                 logger.warning(f"No quadlet files found in {quadlet_dir}")
-                return True, []
+                return True, ()
 
             # Group files by type for ordered processing
-            files_by_type = {
-                'network': [],
-                'volume': [],
-                'image': [],
-                'container': [],
-                'config': []
-            }
+            files_by_type = {file_type: [] for file_type in PROCESSING_ORDER}
 
+            get_file_type = self._get_file_type
             for file_path in quadlet_files:
-                file_type = self._get_file_type(file_path)
-                files_by_type[file_type].append(file_path)
+                files_by_type[get_file_type(file_path)].append(file_path)
 
             # Process all files
             processed_files = []
             deployed_services = []
             app_processed_dir = self.processed_dir / app_name
+            process_quadlet_file = self.env_processor.process_quadlet_file
+            systemd_dir = self.systemd_dir
 
-            # Order: network, volume, image, container
-            processing_order = ['network', 'volume', 'image', 'container', 'config']
+            for file_type in PROCESSING_ORDER:
+                # Invariant for every file of this type
+                suffix = self.QUADLET_TYPES.get(file_type)
+                is_container = file_type == 'container'
 
-            for file_type in processing_order:
                 for file_path in files_by_type[file_type]:
                     # Process the template
                     try:
-                        processed_path = self.env_processor.process_quadlet_file(
+                        processed_path = process_quadlet_file(
                             file_path,
                             app_name,
                             env_vars,
                             app_processed_dir
                         )
                         processed_files.append((processed_path, file_type))
+                        target_path = systemd_dir / (processed_path.stem + suffix if suffix else processed_path.name)
 
                         # Deploy to systemd directory
-                        if self.deploy_processed_file(processed_path, file_type):
-                            if file_type == 'container':
+                        if self.deploy_processed_file(processed_path, file_type, target_path):
+                            if is_container:
                                 deployed_services.append(processed_path.stem)
                         else:
                             logger.error(f"Failed to deploy processed file: {processed_path}")
-                            return False, deployed_services
+                            return False, tuple(deployed_services)
 
                     except Exception as e:
                         logger.error(f"Failed to process quadlet file {file_path}: {e}")
-                        return False, deployed_services
+                        return False, tuple(deployed_services)
 
-            return True, deployed_services
+            return True, tuple(deployed_services)
 
         except Exception as e:
             logger.error(f"Failed to process quadlet files for application {app_name}: {e}")
-            return False, []
+            return False, ()
 
-    def deploy_processed_file(self, processed_path: Path, file_type: str) -> bool:
+    def deploy_processed_file(self, processed_path: Path, file_type: str,
+                              target_path: Optional[Path] = None) -> bool:
         """Deploy a processed file to the systemd directory.
 
         Args:
             processed_path: Path to the processed file
             file_type: Type of the file (container, image, network, volume, config)
+            target_path: Precomputed destination in the systemd directory
 
         Returns:
             Success status
@@ -216,14 +249,32 @@ class QuadletHandler:
         try:
             logger.info(f"Deploying processed file: {processed_path}")
 
-            # Determine target path in systemd directory
-            if file_type in self.QUADLET_TYPES:
-                target_path = self.systemd_dir / f"{processed_path.stem}{self.QUADLET_TYPES[file_type]}"
-            else:
-                target_path = self.systemd_dir / processed_path.name
+            # Determine target path in systemd directory unless the caller already did
+            if target_path is None:
+                suffix = self.QUADLET_TYPES.get(file_type)
+                target_path = self.systemd_dir / (processed_path.stem + suffix if suffix else processed_path.name)
+
+            digest = file_sha256(processed_path) if self.state_manager else None
 
             # Create backup if file exists
             if target_path.exists():
+                target_mtime_ns = target_path.stat().st_mtime_ns
+                stored = self.state_manager.get_file_digest(target_path) if digest else None
+
+                if stored and stored[1] == target_mtime_ns:
+                    # The deployed file is untouched since its digest was recorded,
+                    # so there is no need to read it
+                    unchanged = stored[0] == digest
+                else:
+                    # Streaming byte compare; stops at the first differing block
+                    unchanged = filecmp.cmp(processed_path, target_path, shallow=False)
+                    if unchanged and digest:
+                        self.state_manager.set_file_digest(target_path, digest, target_mtime_ns)
+
+                if unchanged:
+                    logger.info(f"Deployed file is unchanged, skipping: {target_path}")
+                    return True
+
                 backup_path = target_path.parent / f"{target_path.name}.bak"
                 logger.info(f"Creating backup: {backup_path}")
                 shutil.copy2(target_path, backup_path)
@@ -235,6 +286,13 @@ class QuadletHandler:
             # Set permissions
             os.chmod(target_path, 0o644)  # rw-r--r--
 
+            # systemd only picks up the new file after a daemon reload
+            if self.systemd_manager:
+                self.systemd_manager.mark_reload_needed()
+
+            if digest:
+                self.state_manager.set_file_digest(target_path, digest, target_path.stat().st_mtime_ns)
+
             return True
 
         except Exception as e:
@@ -254,6 +312,8 @@ class QuadletHandler:
             if file_path.exists():
                 file_path.unlink()
                 logger.info(f"Removed {file_type} file: {name}")
+                if self.systemd_manager:
+                    self.systemd_manager.mark_reload_needed()
             return True
 
         except Exception as e:
@@ -262,18 +322,12 @@ class QuadletHandler:
 
     def get_deployed_files(self) -> Dict[str, Set[str]]:
         """Get a list of all deployed files by type."""
-        deployed_files = {
-            'container': set(),
-            'image': set(),
-            'network': set(),
-            'volume': set(),
-            'config': set()
-        }
+        deployed_files = {file_type: set() for file_type in PROCESSING_ORDER}
 
+        get_file_type = self._get_file_type
         for file_path in self.systemd_dir.glob('*'):
             if file_path.is_file() and not file_path.name.endswith('.bak'):
-                file_type = self._get_file_type(file_path)
-                deployed_files[file_type].add(file_path.stem)
+                deployed_files[get_file_type(file_path)].add(file_path.stem)
 
         return deployed_files
 
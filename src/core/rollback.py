@@ -1,7 +1,9 @@
+import fnmatch
 import logging
+import os
 import shutil
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -50,16 +52,25 @@ class RollbackManager:
             logger.error(f"Failed to restore from backup {backup_path}: {e}")
             return False
 
+    def _scan_backups(self, pattern: str = "*_*") -> List[Tuple[Path, os.stat_result]]:
+        """Scan the backup directory once, returning matching files with their stat results."""
+        backups = []
+        with os.scandir(self.backup_dir) as entries:
+            for entry in entries:
+                if fnmatch.fnmatchcase(entry.name, pattern):
+                    backups.append((Path(entry.path), entry.stat()))
+        return backups
+
     def get_latest_backup(self, file_name: str) -> Optional[Path]:
         """Get the latest backup for a file."""
         try:
             # Find all backups for the file
-            backups = list(self.backup_dir.glob(f"{file_name}_*"))
+            backups = self._scan_backups(f"{file_name}_*")
             if not backups:
                 return None
 
             # Sort by modification time and get the latest
-            return max(backups, key=lambda p: p.stat().st_mtime)
+            return max(backups, key=lambda b: b[1].st_mtime)[0]
         except Exception as e:
             logger.error(f"Failed to get latest backup for {file_name}: {e}")
             return None
@@ -69,28 +80,36 @@ class RollbackManager:
         try:
             # Group backups by base name
             backup_groups = {}
-            for backup in self.backup_dir.glob("*_*"):
+            for backup, backup_stat in self._scan_backups():
                 base_name = backup.stem.split("_")[0]
                 if base_name not in backup_groups:
                     backup_groups[base_name] = []
-                backup_groups[base_name].append(backup)
+                backup_groups[base_name].append((backup, backup_stat))
 
             # Clean up each group
             for base_name, backups in backup_groups.items():
                 # Sort by modification time
-                backups.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-                
+                backups.sort(key=lambda b: b[1].st_mtime, reverse=True)
+
                 # Remove old backups
-                for backup in backups[max_backups:]:
+                for backup, _ in backups[max_backups:]:
                     backup.unlink()
                     logger.info(f"Removed old backup: {backup}")
         except Exception as e:
             logger.error(f"Failed to cleanup old backups: {e}")
 
-    def list_backups(self) -> List[Path]:
-        """List all available backups."""
+    def list_backups_with_stats(self) -> List[Tuple[Path, os.stat_result]]:
+        """List all available backups with their stat results, newest first.
+
+        Callers that need backup metadata (mtime, size) should use this instead
+        of calling stat() on each path again.
+        """
         try:
-            return sorted(self.backup_dir.glob("*_*"), key=lambda p: p.stat().st_mtime, reverse=True)
+            return sorted(self._scan_backups(), key=lambda b: b[1].st_mtime, reverse=True)
         except Exception as e:
             logger.error(f"Failed to list backups: {e}")
-            return [] 
\ No newline at end of file
+            return []
+
+    def list_backups(self) -> List[Path]:
+        """List all available backups."""
+        return [backup for backup, _ in self.list_backups_with_stats()]
\ No newline at end of file
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Optional
 from croniter import croniter
 import logging
 
@@ -65,6 +66,19 @@ class CronScheduler:
         now = datetime.now()
         return now >= self.next_runs[app_name]
 
+    def seconds_until_next_run(self) -> Optional[float]:
+        """Get the number of seconds until the earliest scheduled run.
+
+        Returns:
+            Seconds until the next application is due (0 if one is already due),
+            or None if no schedules are configured
+        """
+        if not self.next_runs:
+            return None
+
+        next_run = min(self.next_runs.values())
+        return max(0.0, (next_run - datetime.now()).total_seconds())
+
     def update_next_run(self, app_name: str) -> None:
         """Update the next run time for an application after it has run.
 
@@ -1,13 +1,39 @@
 import logging
 import subprocess
 import os
+import threading
+import time
 from pathlib import Path
+from queue import Empty, Queue
 from typing import Optional, List, Dict, Set, Tuple
 
+try:
+    from jeepney import DBusAddress, MatchRule, Properties, new_method_call
+    from jeepney.bus_messages import message_bus
+    from jeepney.io.threading import DBusRouter, open_dbus_connection
+    from jeepney.wrappers import DBusErrorResponse, unwrap_msg
+except ImportError:  # jeepney is optional; systemctl is used without it
+    DBusRouter = None
+
 logger = logging.getLogger(__name__)
 
+# systemd manager object on the user bus
+SYSTEMD_BUS_NAME = "org.freedesktop.systemd1"
+SYSTEMD_PATH = "/org/freedesktop/systemd1"
+SYSTEMD_MANAGER_INTERFACE = "org.freedesktop.systemd1.Manager"
+SYSTEMD_UNIT_INTERFACE = "org.freedesktop.systemd1.Unit"
+
+# Seconds to wait for a D-Bus method reply
+DBUS_CALL_TIMEOUT = 30
+# Seconds to wait for queued systemd jobs to finish
+JOB_TIMEOUT = 300
+
+# Unit active states that count as a successful start or stop job
+STARTED_STATES = ("active", "activating", "reloading")
+STOPPED_STATES = ("inactive", "deactivating", "failed")
+
 class SystemdManager:
-    """Manages systemd services using subprocess commands."""
+    """Manages systemd services over D-Bus, falling back to systemctl commands."""
 
     def __init__(self, quadlet_dir: Path):
         """Initialize the systemd manager.
@@ -21,10 +47,115 @@ class SystemdManager:
         # Cache of service to application mapping
         self._service_app_map: Dict[str, str] = {}
 
+        # Persistent connection to the systemd user manager, if available
+        self._bus = self._connect_bus()
+
+        # Whether unit files may have changed since the last daemon reload;
+        # unknown until this process has reloaded once
+        self._reload_needed = True
+        self._reload_lock = threading.Lock()
+
     def _ensure_directories(self):
         """Ensure necessary directories exist."""
         self.quadlet_dir.mkdir(parents=True, exist_ok=True)
 
+    def _connect_bus(self) -> Optional["DBusRouter"]:
+        """Open a persistent D-Bus connection to the systemd user manager.
+
+        Returns:
+            Router for the user bus, or None if jeepney or the bus is unavailable
+        """
+        if DBusRouter is None:
+            return None
+
+        try:
+            router = DBusRouter(open_dbus_connection(bus="SESSION"))
+        except Exception as e:
+            logger.info(f"D-Bus user bus unavailable, using systemctl: {e}")
+            return None
+
+        try:
+            # Have systemd emit job signals and route them to this connection. No
+            # sender in the rule: signals carry systemd's unique name, not the
+            # well-known one, so it would never match locally
+            self._job_removed_rule = MatchRule(
+                type="signal",
+                interface=SYSTEMD_MANAGER_INTERFACE,
+                member="JobRemoved",
+                path=SYSTEMD_PATH
+            )
+            unwrap_msg(router.send_and_get_reply(
+                message_bus.AddMatch(self._job_removed_rule), timeout=DBUS_CALL_TIMEOUT
+            ))
+            self._call_manager("Subscribe", router=router)
+            logger.info("Connected to systemd user manager over D-Bus")
+            return router
+        except Exception as e:
+            logger.info(f"systemd not reachable over D-Bus, using systemctl: {e}")
+            router.close()
+            router.conn.close()
+            return None
+
+    def _call_manager(self, method: str, signature: Optional[str] = None, *args,
+                      router: Optional["DBusRouter"] = None) -> tuple:
+        """Call a method on the systemd manager object.
+
+        Args:
+            method: Name of the org.freedesktop.systemd1.Manager method
+            signature: D-Bus signature of the arguments
+            *args: Method arguments
+            router: Router to use instead of the persistent connection
+
+        Returns:
+            Tuple with the reply body
+        """
+        manager = DBusAddress(SYSTEMD_PATH, bus_name=SYSTEMD_BUS_NAME, interface=SYSTEMD_MANAGER_INTERFACE)
+        reply = (router or self._bus).send_and_get_reply(
+            new_method_call(manager, method, signature, args), timeout=DBUS_CALL_TIMEOUT
+        )
+        return unwrap_msg(reply)
+
+    def _run_unit_jobs(self, method: str, service_names: List[str]) -> Dict[str, bool]:
+        """Queue a systemd job per service over D-Bus and wait for all of them.
+
+        Like systemctl, a job only counts as successful once systemd reports it done.
+
+        Args:
+            method: Manager method queueing the job (StartUnit, StopUnit, RestartUnit)
+            service_names: Names of the services
+
+        Returns:
+            Dictionary of service names and their success status
+        """
+        results = {service_name: False for service_name in service_names}
+        pending = {}
+        try:
+            # Subscribe before queueing so no JobRemoved signal can be missed
+            with self._bus.filter(self._job_removed_rule, queue=Queue()) as signals:
+                for service_name in service_names:
+                    try:
+                        job_path, = self._call_manager(method, "ss", f"{service_name}.service", "replace")
+                        pending[job_path] = service_name
+                    except DBusErrorResponse as e:
+                        logger.error(f"{method} failed for service {service_name}: {e}")
+
+                deadline = time.monotonic() + JOB_TIMEOUT
+                while pending:
+                    signal = signals.get(timeout=max(0.0, deadline - time.monotonic()))
+                    _, job_path, _, result = signal.body
+                    service_name = pending.pop(job_path, None)
+                    if service_name is None:
+                        continue
+                    if result == "done":
+                        results[service_name] = True
+                    else:
+                        logger.error(f"{method} job for service {service_name} finished with result: {result}")
+        except Empty:
+            logger.error(f"Timed out waiting for {method} jobs: {', '.join(pending.values())}")
+        except Exception as e:
+            logger.error(f"D-Bus {method} failed: {e}")
+        return results
+
     def _run_command(self, command: List[str]) -> Tuple[int, str, str]:
         """Run a systemd command and return the result.
 
@@ -56,12 +187,53 @@ class SystemdManager:
         Returns:
             Success status
         """
+        with self._reload_lock:
+            return self._reload_daemon_locked()
+
+    def _reload_daemon_locked(self) -> bool:
+        """Reload the systemd daemon; the caller must hold _reload_lock.
+
+        Returns:
+            Success status
+        """
+        # Cleared before reloading, so a file deployed by another thread while
+        # the reload runs requests a new one
+        self._reload_needed = False
+
+        if self._bus is not None:
+            try:
+                self._call_manager("Reload")
+                return True
+            except Exception as e:
+                logger.error(f"Failed to reload daemon: {e}")
+                self._reload_needed = True
+                return False
+
         code, stdout, stderr = self._run_command(["systemctl", "daemon-reload"])
         if code != 0:
             logger.error(f"Failed to reload daemon: {stderr}")
+            self._reload_needed = True
             return False
         return True
 
+    def mark_reload_needed(self) -> None:
+        """Record that unit files changed and the daemon must reload them."""
+        self._reload_needed = True
+
+    def reload_daemon_if_needed(self) -> bool:
+        """Reload the systemd daemon unless no unit files changed since the last reload.
+
+        Returns:
+            Success status
+        """
+        # The flag is cleared when a reload starts, so checking it without the
+        # lock could skip a reload that is still running; wait for it instead
+        with self._reload_lock:
+            if not self._reload_needed:
+                logger.debug("No unit files changed since the last daemon reload, skipping")
+                return True
+            return self._reload_daemon_locked()
+
     def start_service(self, service_name: str) -> bool:
         """Start a systemd service.
 
@@ -71,12 +243,99 @@ class SystemdManager:
         Returns:
             Success status
         """
+        if self._bus is not None:
+            return self._run_unit_jobs("StartUnit", [service_name])[service_name]
+
         code, stdout, stderr = self._run_command(["systemctl", "start", f"{service_name}.service"])
         if code != 0:
             logger.error(f"Failed to start service {service_name}: {stderr}")
             return False
         return True
 
+    def _control_services(self, unit_method: str, verb: str, service_names: List[str]) -> Dict[str, bool]:
+        """Run the same job on several systemd services at once.
+
+        Over D-Bus all jobs are queued before waiting for their results;
+        otherwise a single systemctl call is given every unit.
+
+        Args:
+            unit_method: systemd manager method, e.g. "StartUnit"
+            verb: Matching systemctl verb, e.g. "start"
+            service_names: Names of the services
+
+        Returns:
+            Dictionary of service names and their success status
+        """
+        if not service_names:
+            return {}
+
+        if self._bus is not None:
+            return self._run_unit_jobs(unit_method, service_names)
+
+        code, stdout, stderr = self._run_command(
+            ["systemctl", verb, *[f"{service_name}.service" for service_name in service_names]]
+        )
+        if code == 0:
+            return {service_name: True for service_name in service_names}
+
+        logger.error(f"Failed to {verb} services {', '.join(service_names)}: {stderr}")
+        return self._job_outcomes(verb, service_names)
+
+    def _job_outcomes(self, verb: str, service_names: List[str]) -> Dict[str, bool]:
+        """Work out which services a failed multi-unit systemctl call succeeded for.
+
+        Args:
+            verb: systemctl verb that was run, e.g. "start"
+            service_names: Names of the services
+
+        Returns:
+            Dictionary of service names and whether they reached the state the verb asks for
+        """
+        # States a unit may be in once the job succeeded
+        expected_states = STOPPED_STATES if verb == "stop" else STARTED_STATES
+
+        code, stdout, stderr = self._run_command([
+            "systemctl", "show", "--no-pager", "--property=Id,LoadState,ActiveState",
+            *[f"{service_name}.service" for service_name in service_names]
+        ])
+        units = {}
+        for block in stdout.split("\n\n"):
+            properties = dict(line.split("=", 1) for line in block.splitlines() if "=" in line)
+            if "Id" in properties:
+                units[properties["Id"]] = properties
+
+        results = {}
+        for service_name in service_names:
+            properties = units.get(f"{service_name}.service", {})
+            results[service_name] = (properties.get("LoadState") == "loaded"
+                                     and properties.get("ActiveState") in expected_states)
+            if not results[service_name]:
+                logger.error(f"Failed to {verb} service {service_name}: "
+                             f"{properties.get('LoadState', 'unknown')}/{properties.get('ActiveState', 'unknown')}")
+        return results
+
+    def start_services(self, service_names: List[str]) -> Dict[str, bool]:
+        """Start several systemd services with one job request.
+
+        Args:
+            service_names: Names of the services
+
+        Returns:
+            Dictionary of service names and their success status
+        """
+        return self._control_services("StartUnit", "start", service_names)
+
+    def stop_services(self, service_names: List[str]) -> Dict[str, bool]:
+        """Stop several systemd services with one job request.
+
+        Args:
+            service_names: Names of the services
+
+        Returns:
+            Dictionary of service names and their success status
+        """
+        return self._control_services("StopUnit", "stop", service_names)
+
     def stop_service(self, service_name: str) -> bool:
         """Stop a systemd service.
 
@@ -86,6 +345,9 @@ class SystemdManager:
         Returns:
             Success status
         """
+        if self._bus is not None:
+            return self._run_unit_jobs("StopUnit", [service_name])[service_name]
+
         code, stdout, stderr = self._run_command(["systemctl", "stop", f"{service_name}.service"])
         if code != 0:
             logger.error(f"Failed to stop service {service_name}: {stderr}")
@@ -101,6 +363,9 @@ class SystemdManager:
         Returns:
             Success status
         """
+        if self._bus is not None:
+            return self._run_unit_jobs("RestartUnit", [service_name])[service_name]
+
         code, stdout, stderr = self._run_command(["systemctl", "restart", f"{service_name}.service"])
         if code != 0:
             logger.error(f"Failed to restart service {service_name}: {stderr}")
@@ -116,6 +381,21 @@ class SystemdManager:
         Returns:
             Dictionary with status information
         """
+        if self._bus is not None:
+            try:
+                unit_path, = self._call_manager("LoadUnit", "s", f"{service_name}.service")
+                unit = DBusAddress(unit_path, bus_name=SYSTEMD_BUS_NAME, interface=SYSTEMD_UNIT_INTERFACE)
+                reply = self._bus.send_and_get_reply(Properties(unit).get_all(), timeout=DBUS_CALL_TIMEOUT)
+                properties = {name: value for name, (_, value) in unwrap_msg(reply)[0].items()}
+                return {
+                    "active": f"{properties.get('ActiveState', 'unknown')} ({properties.get('SubState', 'unknown')})",
+                    "state": properties.get("SubState", "unknown"),
+                    "details": properties.get("Description", "")
+                }
+            except Exception as e:
+                logger.error(f"Failed to get status of service {service_name}: {e}")
+                return {"active": "unknown", "state": "unknown", "details": str(e)}
+
         code, stdout, stderr = self._run_command(["systemctl", "status", f"{service_name}.service"])
         status = {
             "active": "unknown",
@@ -132,6 +412,84 @@ class SystemdManager:
 
         return status
 
+    def get_many_service_statuses(self, service_names: List[str]) -> Dict[str, Dict[str, str]]:
+        """Get the status of several systemd services with a single query.
+
+        Args:
+            service_names: Names of the services
+
+        Returns:
+            Dictionary of service names and their status information
+        """
+        if not service_names:
+            return {}
+
+        units = {}
+        if self._bus is not None:
+            try:
+                # One ListUnitsByNames call returns every unit, loaded or not
+                entries, = self._call_manager("ListUnitsByNames", "as", [f"{name}.service" for name in service_names])
+                for unit_name, description, _, active_state, sub_state, *_ in entries:
+                    units[unit_name] = {"ActiveState": active_state, "SubState": sub_state, "Description": description}
+            except Exception as e:
+                logger.error(f"Failed to get status of services: {e}")
+        else:
+            code, stdout, stderr = self._run_command([
+                "systemctl", "show", "--no-pager",
+                "--property=Id,ActiveState,SubState,Description",
+                *[f"{name}.service" for name in service_names]
+            ])
+            if code != 0:
+                logger.error(f"Failed to get status of services: {stderr}")
+            # One blank-line separated block of Key=Value lines per unit
+            for block in stdout.split("\n\n"):
+                properties = dict(line.split("=", 1) for line in block.splitlines() if "=" in line)
+                if "Id" in properties:
+                    units[properties["Id"]] = properties
+
+        results = {}
+        for service_name in service_names:
+            properties = units.get(f"{service_name}.service")
+            if not properties:
+                results[service_name] = {"active": "unknown", "state": "unknown", "details": ""}
+                continue
+            results[service_name] = {
+                "active": f"{properties.get('ActiveState', 'unknown')} ({properties.get('SubState', 'unknown')})",
+                "state": properties.get("SubState", "unknown"),
+                "details": properties.get("Description", "")
+            }
+        return results
+
+    def wait_for_inactive(self, service_names: List[str], timeout: float = 30.0) -> bool:
+        """Wait until none of the services is active or still deactivating.
+
+        Stop jobs normally complete before stop_service(s) returns, so the first
+        check usually succeeds; this covers units that are still shutting down.
+
+        Args:
+            service_names: Names of the services
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            True if all services are inactive, False on timeout
+        """
+        deadline = time.monotonic() + timeout
+        interval = 0.05
+        remaining = list(service_names)
+        while remaining:
+            statuses = self.get_many_service_statuses(remaining)
+            # Units that failed to stop or no longer exist count as stopped
+            remaining = [name for name in remaining
+                         if statuses[name]["active"].split(" ", 1)[0] not in ("inactive", "failed", "unknown")]
+            if not remaining:
+                break
+            if time.monotonic() >= deadline:
+                logger.warning(f"Services still active after {timeout}s: {', '.join(remaining)}")
+                return False
+            time.sleep(interval)
+            interval = min(interval * 2, 1.0)
+        return True
+
     def enable_service(self, service_name: str) -> bool:
         """Enable a systemd service to start on boot.
 
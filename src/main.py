@@ -20,6 +20,7 @@ from src.core.scheduler import CronScheduler
 from src.state.manager import StateManager
 from src.metrics import get_metrics_collector
 from src.core.logging import setup_logging, get_logger
+from src.paths import get_default_paths, ensure_directories
 
 # Configure logging
 logging.basicConfig(
@@ -32,6 +33,12 @@ logger = logging.getLogger(__name__)
 running = True
 app_manager = None
 
+# Set on shutdown so the main loop wakes immediately instead of polling
+shutdown_event = threading.Event()
+
+# Upper bound on how long the main loop sleeps between schedule checks
+MAX_WAIT_INTERVAL = 60
+
 # Create FastAPI app
 app = FastAPI(
     title="Podman GitOps",
@@ -68,31 +75,13 @@ def signal_handler(sig, frame):
     global running
     logger.info("Received termination signal, shutting down...")
     running = False
+    shutdown_event.set()
 
 def setup_signal_handlers():
     """Set up signal handlers for graceful shutdown."""
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
-def get_default_paths():
-    """Get default paths for configuration and data."""
-    home_dir = Path.home()
-    return {
-        'config_dir': home_dir / ".local/lib/podman-gitops",
-        'config_file': home_dir / ".local/lib/podman-gitops/config.toml",
-        'state_db': home_dir / ".local/lib/podman-gitops/state.db",
-        'processed_dir': home_dir / ".local/lib/podman-gitops/processed",
-        'repo_dir': home_dir / ".local/lib/podman-gitops/repo",
-        'systemd_dir': home_dir / ".config/containers/systemd",
-        'log_dir': home_dir / ".local/lib/podman-gitops/logs"
-    }
-
-def ensure_directories(paths):
-    """Ensure all necessary directories exist."""
-    for name, path in paths.items():
-        if isinstance(path, Path):
-            path.parent.mkdir(parents=True, exist_ok=True)
-
 def start_api_server(config, host: str, port: int) -> Optional[threading.Thread]:
     """Start the API server in a separate thread."""
     if not config.metrics.enabled or config.metrics.type != "prometheus":
@@ -147,9 +136,7 @@ def main(config_path: Optional[Path] = None, no_api: bool = False) -> int:
             logger.error(f"Configuration file not found: {paths['config_file']}")
             return 1
 
-        config = Config.from_file(paths['config_file'])
-        config.load_app_configs(paths['config_dir'])
-        config.expand_paths()
+        config = Config.load(paths['config_file'], paths['config_dir'], paths['config_cache'])
 
         # Initialize components
         state_manager = StateManager(paths['state_db'])
@@ -157,7 +144,8 @@ def main(config_path: Optional[Path] = None, no_api: bool = False) -> int:
         quadlet_handler = QuadletHandler(
             systemd_dir=config.podman.quadlet_dir,
             processed_dir=paths['processed_dir'],
-            systemd_manager=systemd_manager
+            systemd_manager=systemd_manager,
+            state_manager=state_manager
         )
 
         # Initialize Git operations if configured
@@ -228,18 +216,23 @@ def main(config_path: Optional[Path] = None, no_api: bool = False) -> int:
                 app_manager.git_manager.reset_cycle()
 
                 # Check each application against its schedule
+                due_apps = []
                 for app_name in config.applications.enabled:
                     if scheduler.is_due(app_name):
                         logger.info(f"Application {app_name} is due to run")
-                        results[app_name] = app_manager.process_application(app_name)
-
-                        # Update next run time
-                        scheduler.update_next_run(app_name)
+                        due_apps.append(app_name)
                     else:
                         next_run = scheduler.get_next_run(app_name)
                         if next_run:
                             logger.debug(f"Application {app_name} next run at {next_run}")
 
+                # Deploy all due applications in parallel
+                results = app_manager.process_applications(due_apps)
+
+                # Update next run times
+                for app_name in due_apps:
+                    scheduler.update_next_run(app_name)
+
                 # Record metrics if there were processed apps
                 if results and metrics_collector:
                     duration = time.time() - start_time
@@ -263,19 +256,17 @@ def main(config_path: Optional[Path] = None, no_api: bool = False) -> int:
                     if hasattr(metrics_collector, 'update_active_containers'):
                         metrics_collector.update_active_containers(active_services)
 
-                # Wait a short time before checking schedules again
-                wait_interval = 10  # Check schedules every 10 seconds
-                logger.debug(f"Waiting {wait_interval} seconds before checking schedules again")
-
-                # Use a small wait interval to check running flag more frequently
-                for _ in range(wait_interval):
-                    if not running:
-                        break
-                    time.sleep(1)
+                # Sleep until the next application is due (or shutdown is requested)
+                wait_interval = scheduler.seconds_until_next_run()
+                if wait_interval is None:
+                    wait_interval = MAX_WAIT_INTERVAL
+                wait_interval = min(max(wait_interval, 1), MAX_WAIT_INTERVAL)
+                logger.debug(f"Waiting {wait_interval:.1f} seconds before checking schedules again")
+                shutdown_event.wait(wait_interval)
 
             except Exception as e:
                 logger.error(f"Error in main loop: {e}", exc_info=True)
-                time.sleep(60)  # Wait a bit before retrying
+                shutdown_event.wait(60)  # Wait a bit before retrying
 
         logger.info("Service shutdown complete")
         return 0
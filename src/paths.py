@@ -0,0 +1,49 @@
+"""
+Default filesystem locations for Podman GitOps.
+
+Kept free of third-party imports so the CLI can resolve paths without loading
+the service modules.
+"""
+
+import functools
+import os
+from pathlib import Path
+from typing import Dict, Set
+
+@functools.lru_cache(maxsize=1)
+def _default_paths() -> Dict[str, Path]:
+    """Build the default paths once per process."""
+    # Plain string joins avoid a Path division (and normalization) per entry
+    home_dir = os.path.expanduser("~")
+    base = home_dir + "/.local/lib/podman-gitops"
+    return {
+        'config_dir': Path(base),
+        'config_file': Path(base + "/config.toml"),
+        'config_cache': Path(base + "/.cache/config.pkl"),
+        'state_db': Path(base + "/state.db"),
+        'processed_dir': Path(base + "/processed"),
+        'repo_dir': Path(base + "/repo"),
+        'systemd_dir': Path(home_dir + "/.config/containers/systemd"),
+        'log_dir': Path(base + "/logs")
+    }
+
+def get_default_paths() -> Dict[str, Path]:
+    """Get default paths for configuration and data."""
+    # Return a copy so callers can override entries without touching the cache
+    return dict(_default_paths())
+
+# Directories already known to exist in this process
+_ENSURED_DIRS: Set[Path] = set()
+
+def ensure_directories(paths):
+    """Ensure all necessary directories exist."""
+    parents = {path.parent for path in paths.values() if isinstance(path, Path)} - _ENSURED_DIRS
+
+    # makedirs creates ancestors too, so only the deepest directories need a call
+    leaves = [parent for parent in parents
+              if not any(parent in other.parents for other in parents)]
+    for parent in leaves:
+        # exist_ok makes this a single mkdir on existing directories, no stat first
+        os.makedirs(parent, exist_ok=True)
+        _ENSURED_DIRS.add(parent)
+        _ENSURED_DIRS.update(parent.parents)
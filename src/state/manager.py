@@ -1,9 +1,11 @@
 import logging
 import json
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Union, Iterator, Sequence, Tuple
 
 import peewee as pw
 
@@ -12,6 +14,27 @@ logger = logging.getLogger(__name__)
 # Database instance
 db = pw.SqliteDatabase(None)  # Initialized with None, set actual path later
 
+# SQLite pragmas applied to every connection: WAL lets readers run alongside the
+# writer and synchronous=NORMAL only fsyncs at checkpoints instead of every commit
+DB_PRAGMAS = {
+    'journal_mode': 'wal',
+    'synchronous': 'normal',
+    'busy_timeout': 5000,
+}
+
+# Pragmas for read-only connections used by status commands: the journal mode
+# is left as set by the writer, and reads are served from a memory map
+READONLY_DB_PRAGMAS = {
+    'query_only': 1,
+    'mmap_size': 256 * 1024 * 1024,
+    'busy_timeout': 5000,
+}
+
+# Serializes write transactions across threads. SQLite allows a single writer,
+# and a transaction that reads before writing cannot wait for a lock held by
+# another connection, so writers queue here instead of failing as busy
+_WRITE_LOCK = threading.RLock()
+
 # Base model class
 class BaseModel(pw.Model):
     class Meta:
@@ -70,6 +93,12 @@ class ErrorLog(BaseModel):
             (('app_name', 'service_name'), False),
         )
 
+class DeployedFile(BaseModel):
+    path = pw.CharField(primary_key=True)
+    sha256 = pw.CharField()
+    mtime_ns = pw.BigIntegerField()  # mtime of the deployed copy when the digest was taken
+    last_updated = pw.DateTimeField(default=datetime.now)
+
 @dataclass
 class DeploymentState:
     """Represents the state of a deployment."""
@@ -83,21 +112,45 @@ class DeploymentState:
 class StateManager:
     """Manages the state of GitOps deployments using Peewee ORM."""
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, readonly: bool = False):
         """Initialize the state manager with a database path.
 
         Args:
             db_path: Path to the SQLite database file
+            readonly: Open an existing database read-only, for commands that
+                only report state. A missing database is created read-write.
         """
         self.db_path = Path(str(db_path))
+        self.readonly = readonly and self.db_path.exists()
+
+        if self.readonly:
+            self._database = f"file:{self.db_path}?mode=ro"
+            self.activate()
+            return
 
         # Create parent directory if it doesn't exist
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Initialize the database
-        db.init(str(self.db_path))
+        self._database = str(self.db_path)
+        self.activate()
         self._init_db()
 
+    def activate(self) -> None:
+        """Point the shared database connection at this manager's database.
+
+        Needed when several state managers are used in the same process, e.g.
+        a read-only and a read-write one created by different CLI commands.
+        """
+        if db.database == self._database:
+            return
+
+        if self.readonly:
+            db.init(self._database, pragmas=READONLY_DB_PRAGMAS, uri=True,
+                    cached_statements=256)
+        else:
+            db.init(self._database, pragmas=DB_PRAGMAS)
+
     def _init_db(self):
         """Initialize the database with required tables."""
         try:
@@ -107,13 +160,26 @@ class StateManager:
                 Deployment,
                 Service,
                 HealthCheck,
-                ErrorLog
+                ErrorLog,
+                DeployedFile
             ])
             logger.info("Database initialized successfully")
         except pw.DatabaseError as e:
             logger.error(f"Failed to initialize database: {e}")
             raise
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group several state updates into a single database transaction.
+
+        Calls made inside the block join the outer transaction, so all of them
+        are committed together (or rolled back together on error). The write
+        lock is taken up front (BEGIN IMMEDIATE), so a transaction that reads
+        before writing waits for other processes instead of failing as busy.
+        """
+        with _WRITE_LOCK, db.atomic('IMMEDIATE'):
+            yield
+
     def register_application(self, app_name: str, description: Optional[str] = None, config_hash: Optional[str] = None) -> bool:
         """Register an application in the state database.
 
@@ -126,7 +192,7 @@ class StateManager:
             Success status
         """
         try:
-            with db.atomic():
+            with self.transaction():
                 app, created = Application.get_or_create(
                     app_name=app_name,
                     defaults={
@@ -137,9 +203,11 @@ class StateManager:
                 )
 
                 if not created:
-                    # Update existing application
-                    app.description = description
-                    app.config_hash = config_hash
+                    # Update existing application, keeping fields that were not given
+                    if description is not None:
+                        app.description = description
+                    if config_hash is not None:
+                        app.config_hash = config_hash
                     app.last_updated = datetime.now()
                     app.save()
 
@@ -149,6 +217,22 @@ class StateManager:
             logger.error(f"Failed to register application {app_name}: {e}")
             return False
 
+    def get_config_hash(self, app_name: str) -> Optional[str]:
+        """Get the configuration hash recorded for an application.
+
+        Args:
+            app_name: Name of the application
+
+        Returns:
+            Configuration hash or None if none was recorded
+        """
+        try:
+            app = Application.get_or_none(Application.app_name == app_name)
+            return app.config_hash if app else None
+        except pw.DatabaseError as e:
+            logger.error(f"Failed to get configuration hash for {app_name}: {e}")
+            return None
+
     def deregister_application(self, app_name: str) -> bool:
         """Remove an application and all its related data from the state database.
 
@@ -159,7 +243,7 @@ class StateManager:
             Success status
         """
         try:
-            with db.atomic():
+            with self.transaction():
                 # Delete all health checks for this application's services
                 HealthCheck.delete().where(HealthCheck.app_name == app_name).execute()
 
@@ -197,7 +281,7 @@ class StateManager:
             ID of the deployment record
         """
         try:
-            with db.atomic():
+            with self.transaction():
                 # Ensure application exists
                 self.register_application(app_name)
 
@@ -226,7 +310,7 @@ class StateManager:
             Success status
         """
         try:
-            with db.atomic():
+            with self.transaction():
                 try:
                     deployment = Deployment.get_by_id(deployment_id)
                     deployment.status = status
@@ -256,7 +340,7 @@ class StateManager:
             ID of the deployment record
         """
         try:
-            with db.atomic():
+            with self.transaction():
                 # Ensure application exists
                 self.register_application(app_name)
 
@@ -289,7 +373,7 @@ class StateManager:
             Success status
         """
         try:
-            with db.atomic():
+            with self.transaction():
                 # Ensure application exists
                 self.register_application(app_name)
 
@@ -355,6 +439,39 @@ class StateManager:
             logger.error(f"Failed to get application services: {e}")
             raise
 
+    def get_app_service_names(self, app_name: str) -> Tuple[str, ...]:
+        """Get the names of all services of an application.
+
+        Args:
+            app_name: Name of the application
+
+        Returns:
+            Tuple of service names, sorted by name
+        """
+        try:
+            query = (Service
+                     .select(Service.service_name)
+                     .where(Service.app_name == app_name)
+                     .order_by(Service.service_name)
+                     .tuples())
+            return tuple(service_name for service_name, in query)
+        except pw.DatabaseError as e:
+            logger.error(f"Failed to get application service names: {e}")
+            raise
+
+    def get_service_app_map(self) -> Dict[str, str]:
+        """Get the application each known service belongs to.
+
+        Returns:
+            Dictionary of service names and their application names
+        """
+        try:
+            query = Service.select(Service.service_name, Service.app_name).tuples()
+            return {service_name: app_name for service_name, app_name in query}
+        except pw.DatabaseError as e:
+            logger.error(f"Failed to get service to application map: {e}")
+            raise
+
     def add_health_check(self, app_name: str, service_name: str, health_data: Dict[str, Any]) -> bool:
         """Add a health check result.
 
@@ -367,7 +484,7 @@ class StateManager:
             Success status
         """
         try:
-            with db.atomic():
+            with self.transaction():
                 # Ensure service exists
                 service = Service.get_or_none(Service.app_name == app_name, Service.service_name == service_name)
                 if not service:
@@ -392,6 +509,46 @@ class StateManager:
             logger.error(f"Failed to add health check: {e}")
             return False
 
+    def get_file_digest(self, path: Path) -> Optional[Tuple[str, int]]:
+        """Get the stored digest of a deployed file.
+
+        Args:
+            path: Path of the deployed file
+
+        Returns:
+            Tuple of (sha256 hex digest, mtime_ns) or None if not recorded
+        """
+        try:
+            deployed = DeployedFile.get_or_none(DeployedFile.path == str(path))
+            return (deployed.sha256, deployed.mtime_ns) if deployed else None
+        except pw.DatabaseError as e:
+            logger.error(f"Failed to get digest of {path}: {e}")
+            return None
+
+    def set_file_digest(self, path: Path, sha256: str, mtime_ns: int) -> bool:
+        """Record the digest of a deployed file.
+
+        Args:
+            path: Path of the deployed file
+            sha256: Hex digest of the deployed content
+            mtime_ns: Modification time of the deployed file in nanoseconds
+
+        Returns:
+            Success status
+        """
+        try:
+            with self.transaction():
+                DeployedFile.replace(
+                    path=str(path),
+                    sha256=sha256,
+                    mtime_ns=mtime_ns,
+                    last_updated=datetime.now()
+                ).execute()
+            return True
+        except pw.DatabaseError as e:
+            logger.error(f"Failed to record digest of {path}: {e}")
+            return False
+
     def get_service_health_history(self, app_name: str, service_name: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get the health check history of a service.
 
@@ -435,7 +592,7 @@ class StateManager:
             Success status
         """
         try:
-            with db.atomic():
+            with self.transaction():
                 # Log error
                 ErrorLog.create(
                     app_name=app_name,
@@ -495,7 +652,7 @@ class StateManager:
             Success status
         """
         try:
-            with db.atomic():
+            with self.transaction():
                 try:
                     error = ErrorLog.get_by_id(error_id)
                     error.resolved = True
@@ -659,17 +816,9 @@ class StateManager:
                                .count())
 
                 # Determine overall status
-                overall_status = "healthy"  # Default
-                if error_count > 0:
-                    overall_status = "error"
-                elif "error" in state_counts or "failed" in state_counts:
-                    overall_status = "error"
-                elif "unhealthy" in state_counts:
-                    overall_status = "unhealthy"
-                elif last_deployment and last_deployment.status == "failed":
-                    overall_status = "deployment_failed"
-                elif not services:
-                    overall_status = "no_services"
+                overall_status = self._overall_status(
+                    error_count, state_counts, last_deployment.status if last_deployment else None
+                )
 
                 # Prepare summary
                 summary = {
@@ -693,6 +842,185 @@ class StateManager:
             logger.error(f"Failed to get app status summary: {e}")
             return {"status": "error", "app_name": app_name, "error": str(e)}
 
+    @staticmethod
+    def _overall_status(error_count: int, state_counts: Dict[str, int], last_deployment_status: Optional[str]) -> str:
+        """Derive the overall status of an application.
+
+        Args:
+            error_count: Number of unresolved errors
+            state_counts: Number of services per state
+            last_deployment_status: Status of the last deployment, if any
+
+        Returns:
+            Overall status string
+        """
+        if error_count > 0:
+            return "error"
+        elif "error" in state_counts or "failed" in state_counts:
+            return "error"
+        elif "unhealthy" in state_counts:
+            return "unhealthy"
+        elif last_deployment_status == "failed":
+            return "deployment_failed"
+        elif not state_counts:
+            return "no_services"
+        return "healthy"
+
+    def get_app_summaries(self) -> Dict[str, Dict[str, Any]]:
+        """Get a light status summary of all enabled applications.
+
+        Unlike get_status_all_applications this does not list individual
+        services; it aggregates them with a few grouped queries for all
+        applications at once.
+
+        Returns:
+            Dictionary of application names and their summaries
+        """
+        try:
+            with db.atomic():
+                applications = list(Application.select().where(Application.enabled == True))
+
+                state_counts: Dict[str, Dict[str, int]] = {}
+                query = (Service
+                         .select(Service.app_name, Service.state, pw.fn.COUNT(Service.service_name))
+                         .group_by(Service.app_name, Service.state)
+                         .tuples())
+                for app_name, state, count in query:
+                    state_counts.setdefault(app_name, {})[state] = count
+
+                error_counts = dict(ErrorLog
+                                    .select(ErrorLog.app_name, pw.fn.COUNT(ErrorLog.id))
+                                    .where(ErrorLog.resolved == False)
+                                    .group_by(ErrorLog.app_name)
+                                    .tuples())
+
+                # Latest deployment per application
+                latest = (Deployment
+                          .select(Deployment.app_name.alias('app'), pw.fn.MAX(Deployment.timestamp).alias('latest'))
+                          .group_by(Deployment.app_name)
+                          .alias('latest'))
+                query = Deployment.select().join(
+                    latest,
+                    on=((Deployment.app_name == latest.c.app) & (Deployment.timestamp == latest.c.latest))
+                )
+                last_deployments = {deployment.app_name_id: deployment for deployment in query}
+
+                summaries = {}
+                for app in applications:
+                    counts = state_counts.get(app.app_name, {})
+                    last_deployment = last_deployments.get(app.app_name)
+                    summary = {
+                        "app_name": app.app_name,
+                        "description": app.description,
+                        "service_count": sum(counts.values()),
+                        "state_counts": counts,
+                        "error_count": error_counts.get(app.app_name, 0),
+                        "overall_status": self._overall_status(
+                            error_counts.get(app.app_name, 0),
+                            counts,
+                            last_deployment.status if last_deployment else None
+                        )
+                    }
+                    if last_deployment:
+                        summary["last_deployment"] = {
+                            "id": last_deployment.id,
+                            "commit_hash": last_deployment.commit_hash,
+                            "timestamp": last_deployment.timestamp,
+                            "status": last_deployment.status,
+                            "error_message": last_deployment.error_message
+                        }
+                    summaries[app.app_name] = summary
+                return summaries
+        except pw.DatabaseError as e:
+            logger.error(f"Failed to get application summaries: {e}")
+            raise
+
+    def get_status_summaries(self, app_names: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """Get status summaries of several applications.
+
+        Returns the same summaries as get_app_status_summary, but reads them
+        with one query per table for all applications instead of several
+        queries per application.
+
+        Args:
+            app_names: Names of the applications
+
+        Returns:
+            Dictionary of application names and their status summaries
+        """
+        try:
+            with db.atomic():
+                applications = {
+                    app.app_name: app
+                    for app in Application.select().where(Application.app_name.in_(app_names))
+                }
+
+                services: Dict[str, Dict[str, str]] = {}
+                query = (Service
+                         .select(Service.app_name, Service.service_name, Service.state)
+                         .where(Service.app_name.in_(app_names))
+                         .tuples())
+                for app_name, service_name, state in query:
+                    services.setdefault(app_name, {})[service_name] = state
+
+                error_counts = dict(ErrorLog
+                                    .select(ErrorLog.app_name, pw.fn.COUNT(ErrorLog.id))
+                                    .where(ErrorLog.app_name.in_(app_names), ErrorLog.resolved == False)
+                                    .group_by(ErrorLog.app_name)
+                                    .tuples())
+
+                # Latest deployment per application
+                latest = (Deployment
+                          .select(Deployment.app_name.alias('app'), pw.fn.MAX(Deployment.timestamp).alias('latest'))
+                          .where(Deployment.app_name.in_(app_names))
+                          .group_by(Deployment.app_name)
+                          .alias('latest'))
+                query = Deployment.select().join(
+                    latest,
+                    on=((Deployment.app_name == latest.c.app) & (Deployment.timestamp == latest.c.latest))
+                )
+                last_deployments = {deployment.app_name_id: deployment for deployment in query}
+
+            summaries = {}
+            for app_name in app_names:
+                app = applications.get(app_name)
+                if not app:
+                    summaries[app_name] = {"status": "not_found", "app_name": app_name}
+                    continue
+
+                app_services = services.get(app_name, {})
+                state_counts: Dict[str, int] = {}
+                for state in app_services.values():
+                    state_counts[state] = state_counts.get(state, 0) + 1
+
+                error_count = error_counts.get(app_name, 0)
+                last_deployment = last_deployments.get(app_name)
+                summary = {
+                    "app_name": app_name,
+                    "description": app.description,
+                    "last_updated": app.last_updated,
+                    "services": app_services,
+                    "service_count": len(app_services),
+                    "state_counts": state_counts,
+                    "error_count": error_count,
+                    "overall_status": self._overall_status(
+                        error_count, state_counts, last_deployment.status if last_deployment else None
+                    )
+                }
+                if last_deployment:
+                    summary["last_deployment"] = {
+                        "id": last_deployment.id,
+                        "commit_hash": last_deployment.commit_hash,
+                        "timestamp": last_deployment.timestamp,
+                        "status": last_deployment.status,
+                        "error_message": last_deployment.error_message
+                    }
+                summaries[app_name] = summary
+            return summaries
+        except pw.DatabaseError as e:
+            logger.error(f"Failed to get application status summaries: {e}")
+            raise
+
     def get_status_all_applications(self) -> Dict[str, Dict[str, Any]]:
         """Get status of all applications.
 
@@ -701,13 +1029,13 @@ class StateManager:
         """
         try:
             # Get all application names
-            applications = Application.select().where(Application.enabled == True)
+            app_names = [
+                app_name
+                for app_name, in Application.select(Application.app_name).where(Application.enabled == True).tuples()
+            ]
 
-            # Get status for each application
-            return {
-                app.app_name: self.get_app_status_summary(app.app_name)
-                for app in applications
-            }
+            # Get status of all applications at once
+            return self.get_status_summaries(app_names)
         except pw.DatabaseError as e:
             logger.error(f"Failed to get status of all applications: {e}")
             raise
\ No newline at end of file
@@ -0,0 +1,237 @@
+import pytest
+from pathlib import Path
+from src.core import app_manager as app_manager_module
+from src.core.app_manager import ApplicationManager
+from src.core.config import Config, ApplicationConfig
+from src.state.manager import StateManager
+
+class FakeHealthChecker:
+    """Health checker that reports every container as healthy."""
+
+    def __init__(self, *args, **kwargs):
+        self.unhealthy = set()
+
+    def invalidate_health_cache(self, container_name=None):
+        pass
+
+    def check_container_health(self, container_name, use_cache=True):
+        healthy = container_name not in self.unhealthy
+        return {"status": "healthy" if healthy else "not_running", "state": "running", "healthy": healthy}
+
+    def check_many(self, container_names, use_cache=True):
+        return {name: self.check_container_health(name, use_cache) for name in container_names}
+
+    def wait_for_healthy(self, container_name, timeout=30):
+        return container_name not in self.unhealthy
+
+    def wait_for_many_healthy(self, container_names, timeout=30):
+        return {name: self.wait_for_healthy(name, timeout) for name in container_names}
+
+    def get_container_logs(self, container_name, lines=50, max_bytes=None):
+        return "log line"
+
+class FakeSystemdManager:
+    """Systemd manager that records calls instead of running systemctl."""
+
+    def __init__(self):
+        self.started = []
+        self.stopped = []
+        self.failing = set()
+        self.reloads = 0
+        self.status_queries = []
+
+    def reload_daemon(self):
+        self.reloads += 1
+        return True
+
+    def reload_daemon_if_needed(self):
+        return self.reload_daemon()
+
+    def start_service(self, service_name):
+        self.started.append(service_name)
+        return service_name not in self.failing
+
+    def stop_service(self, service_name):
+        self.stopped.append(service_name)
+        return service_name not in self.failing
+
+    def start_services(self, service_names):
+        return {name: self.start_service(name) for name in service_names}
+
+    def stop_services(self, service_names):
+        return {name: self.stop_service(name) for name in service_names}
+
+    def wait_for_inactive(self, service_names, timeout=30):
+        return True
+
+    def get_many_service_statuses(self, service_names):
+        self.status_queries.append(list(service_names))
+        return {name: {"active": "active (running)", "state": "running", "details": ""} for name in service_names}
+
+class FakeQuadletHandler:
+    """Quadlet handler that deploys a fixed list of services."""
+
+    def __init__(self, services):
+        self.services = services
+        self.success = True
+
+    def process_and_deploy_app_quadlets(self, app_name, quadlet_dir, env_vars=None):
+        return self.success, tuple(self.services)
+
+@pytest.fixture
+def app_manager(tmp_path, monkeypatch):
+    """Create an ApplicationManager for a single local (non-Git) application."""
+    monkeypatch.setattr(app_manager_module, "HealthChecker", FakeHealthChecker)
+
+    config = Config()
+    config.applications.enabled = ["web"]
+    config.app_configs["web"] = ApplicationConfig(name="web", quadlet_dir=tmp_path / "quadlets")
+
+    return ApplicationManager(
+        config=config,
+        state_manager=StateManager(tmp_path / "state.db"),
+        quadlet_handler=FakeQuadletHandler(["web-app", "web-db"]),
+        systemd_manager=FakeSystemdManager()
+    )
+
+def test_process_application_success(app_manager):
+    """Test a successful deployment of all services."""
+    assert app_manager.process_application("web") is True
+
+    assert app_manager.systemd_manager.started == ["web-app", "web-db"]
+    assert app_manager.state_manager.get_app_services("web") == {"web-app": "running", "web-db": "running"}
+    last = app_manager.state_manager.get_deployment_history("web", limit=1)[0]
+    assert last.status == "success"
+    assert last.commit_hash == "local"
+
+def test_process_application_skips_unchanged(app_manager, tmp_path):
+    """Test that an unchanged, healthy application is not redeployed."""
+    assert app_manager.process_application("web") is True
+    assert app_manager.process_application("web") is True
+    assert app_manager.systemd_manager.started == ["web-app", "web-db"]
+    assert len(app_manager.state_manager.get_deployment_history("web")) == 1
+
+    # A changed quadlet file triggers a new deployment
+    (tmp_path / "quadlets" / "web.container").write_text("[Container]\n")
+    assert app_manager.process_application("web") is True
+    assert len(app_manager.state_manager.get_deployment_history("web")) == 2
+
+def test_process_application_unknown_app(app_manager):
+    """Test that unconfigured applications are rejected."""
+    assert app_manager.process_application("missing") is False
+
+def test_process_application_start_failure(app_manager):
+    """Test that a failed service start fails the deployment."""
+    app_manager.systemd_manager.failing.add("web-db")
+
+    assert app_manager.process_application("web") is False
+
+    services = app_manager.state_manager.get_app_services("web")
+    assert services["web-app"] == "running"
+    assert services["web-db"] == "error"
+    last = app_manager.state_manager.get_deployment_history("web", limit=1)[0]
+    assert last.status == "failed"
+    assert last.error_message == "Some services failed to start"
+
+def test_process_application_unhealthy(app_manager):
+    """Test that an unhealthy service fails the deployment."""
+    app_manager.health_checker.unhealthy.add("web-app")
+
+    assert app_manager.process_application("web") is False
+
+    history = app_manager.state_manager.get_deployment_history("web")
+    assert len(history) == 1
+    assert history[0].status == "failed"
+    assert history[0].error_message == "Some services are unhealthy or unstable"
+
+def test_process_application_quadlet_failure(app_manager):
+    """Test that a quadlet processing failure is recorded once."""
+    app_manager.quadlet_handler.success = False
+
+    assert app_manager.process_application("web") is False
+    assert app_manager.systemd_manager.started == []
+
+    history = app_manager.state_manager.get_deployment_history("web")
+    assert len(history) == 1
+    assert history[0].error_message == "Failed to process quadlet files"
+
+def test_find_app_for_service(app_manager):
+    """Test the service to application reverse index."""
+    assert app_manager.find_app_for_service("web-app") is None
+
+    app_manager.process_application("web")
+
+    assert app_manager.find_app_for_service("web-app") == "web"
+    assert app_manager.find_app_for_service("web-db") == "web"
+    assert app_manager.find_app_for_service("other") is None
+
+def test_get_status_all_applications(app_manager):
+    """Test that systemd is queried once for all services of all applications."""
+    app_manager.process_application("web")
+
+    statuses = app_manager.get_status_all_applications()
+
+    assert statuses["web"]["services"] == {"web-app": "running", "web-db": "running"}
+    assert statuses["web"]["systemd"]["web-db"]["active"] == "active (running)"
+    assert app_manager.systemd_manager.status_queries == [["web-app", "web-db"]]
+
+def test_get_summaries_all_applications(app_manager):
+    """Test that summaries aggregate services without listing them."""
+    app_manager.process_application("web")
+
+    summary = app_manager.get_summaries_all_applications()["web"]
+
+    assert summary["service_count"] == 2
+    assert summary["state_counts"] == {"running": 2}
+    assert summary["last_deployment"]["status"] == "success"
+    assert summary["overall_status"] == "healthy"
+    assert "services" not in summary
+
+def test_stop_and_start_application(app_manager):
+    """Test stopping and starting the deployed services of an application."""
+    assert app_manager.stop_application("web") is False  # nothing deployed yet
+
+    app_manager.process_application("web")
+    app_manager.systemd_manager.failing.add("web-db")
+
+    assert app_manager.stop_application("web") is False
+    assert app_manager.systemd_manager.stopped == ["web-app", "web-db"]
+    assert app_manager.state_manager.get_app_services("web") == {"web-app": "stopped", "web-db": "error"}
+
+    app_manager.systemd_manager.failing.clear()
+    assert app_manager.start_application("web") is True
+    assert app_manager.state_manager.get_app_services("web") == {"web-app": "running", "web-db": "running"}
+
+    assert app_manager.restart_application("web") is True
+    assert app_manager.systemd_manager.stopped[-2:] == ["web-app", "web-db"]
+
+def test_process_all_applications(app_manager, tmp_path):
+    """Test that every enabled application is deployed."""
+    app_manager.config.applications.enabled.append("api")
+    app_manager.config.app_configs["api"] = ApplicationConfig(name="api", quadlet_dir=tmp_path / "api")
+
+    assert app_manager.process_all_applications() == {"web": True, "api": True}
+    assert app_manager.processed_apps == {"web", "api"}
+    assert app_manager.state_manager.get_app_services("api") == {"web-app": "running", "web-db": "running"}
+
+    # An application that fails (here with an unexpected error) is no longer processed
+    def failing_process(app_name):
+        raise RuntimeError("boom")
+    app_manager.process_application = failing_process
+    assert app_manager.process_applications(["web"]) == {"web": False}
+    assert app_manager.processed_apps == {"api"}
+
+def test_get_status_all_applications_fallback(app_manager, monkeypatch):
+    """Test that the fallback batches status queries for configured applications."""
+    app_manager.process_application("web")
+    expected = app_manager.state_manager.get_app_status_summary("web")
+
+    def failing_status():
+        raise RuntimeError("state unavailable")
+    monkeypatch.setattr(app_manager.state_manager, "get_status_all_applications", failing_status)
+
+    status = app_manager.get_status_all_applications()["web"]
+
+    assert status["services"] == expected["services"]
+    assert status["overall_status"] == expected["overall_status"]
+    assert status["config"]["env_var_count"] == 0
@@ -0,0 +1,102 @@
+import os
+import pytest
+from pathlib import Path
+from src.core.config import Config
+
+@pytest.fixture
+def config_files(tmp_path):
+    """Write a main config and one application config."""
+    (tmp_path / "config.toml").write_text('[applications]\nenabled = ["web"]\n')
+    (tmp_path / "web.toml").write_text('[application]\nquadlet_dir = "~/quadlets"\n')
+    return tmp_path / "config.toml", tmp_path
+
+def test_load_expands_paths(config_files):
+    """Test that load parses app configs and expands their paths."""
+    config = Config.load(*config_files)
+
+    assert config.app_configs["web"].quadlet_dir == Path("~/quadlets").expanduser()
+
+def test_load_reuses_cache_until_files_change(config_files):
+    """Test that an unchanged config is served from cache as an independent copy."""
+    config_file, config_dir = config_files
+    first = Config.load(config_file, config_dir)
+    first.applications.enabled.append("mutated")
+
+    second = Config.load(config_file, config_dir)
+    assert second.applications.enabled == ["web"]
+
+    # Any change to an application config invalidates the cache
+    app_file = config_dir / "web.toml"
+    app_file.write_text('[application]\nquadlet_dir = "/srv/web"\ndescription = "Web"\n')
+    stat = app_file.stat()
+    os.utime(app_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    third = Config.load(config_file, config_dir)
+    assert third.app_configs["web"].description == "Web"
+
+def test_load_parses_app_configs_on_access(config_files):
+    """Test that application configs are only parsed when first accessed."""
+    config_file, config_dir = config_files
+    (config_dir / "config.toml").write_text('[applications]\nenabled = ["web", "db", "missing"]\n')
+    (config_dir / "db.toml").write_text('[application]\nquadlet_dir = "/srv/db"\n')
+
+    config = Config.load(config_file, config_dir)
+    assert config.app_configs.loaded == {}
+
+    assert config.app_configs["db"].quadlet_dir == Path("/srv/db")
+    assert list(config.app_configs.loaded) == ["db"]
+
+    # Iterating lists the applications with a file without parsing them
+    assert sorted(config.app_configs) == ["db", "web"]
+    assert len(config.app_configs) == 2
+    assert list(config.app_configs.loaded) == ["db"]
+
+    # Values parse the rest
+    assert len(list(config.app_configs.values())) == 2
+    assert sorted(config.app_configs.loaded) == ["db", "web"]
+    assert config.app_configs.get("missing") is None
+
+def test_load_uses_compiled_cache(config_files, monkeypatch):
+    """Test that a fresh process reuses the compiled config without parsing."""
+    from src.core import config as config_module
+
+    config_file, config_dir = config_files
+    cache_file = config_dir / ".cache" / "config.pkl"
+    Config.load(config_file, config_dir, cache_file)
+    assert cache_file.exists()
+
+    # Simulate a new process that must not parse any TOML
+    Config.invalidate_cache(config_file)
+    monkeypatch.setattr(config_module, "_load_toml_file", None)
+
+    config = Config.load(config_file, config_dir, cache_file)
+    assert config.app_configs["web"].quadlet_dir == Path("~/quadlets").expanduser()
+
+def test_from_toml_skips_validation_unless_requested():
+    """Test that trusted configs are built without validation but keep Path fields."""
+    toml_str = '[podman]\nquadlet_dir = "/srv/quadlets"\n[git]\nrepository_url = "https://example.com/repo.git"\n'
+
+    config = Config.from_toml(toml_str)
+    assert config.podman.quadlet_dir == Path("/srv/quadlets")
+    assert config.git.branch == "main"
+    assert config.metrics.port == 8000
+
+    with pytest.raises(ValueError, match="repository_url"):
+        Config.from_toml('[git]\nbranch = "main"\n')
+
+    with pytest.raises(ValueError):
+        Config.from_toml('[metrics]\nport = "not a port"\n', validate=True)
+
+def test_enabled_set_follows_enabled_changes():
+    """Test that the enabled set reflects later changes to enabled."""
+    config = Config.from_toml('[applications]\nenabled = ["web"]\n')
+    assert config.applications.enabled_set == {"web"}
+
+    config.applications.enabled.append("api")
+    assert config.applications.enabled_set == {"web", "api"}
+
+    config.applications.enabled = ["db"]
+    assert config.applications.enabled_set == {"db"}
+
+    config.applications.enabled[0] = "cache"
+    assert config.applications.enabled_set == {"cache"}
@@ -0,0 +1,96 @@
+import pytest
+from pathlib import Path
+from src.core.quadlet_handler import QuadletHandler, file_sha256
+
+@pytest.fixture
+def quadlet_handler(tmp_path):
+    """Create a QuadletHandler instance with temporary directories."""
+    return QuadletHandler(
+        systemd_dir=tmp_path / "systemd",
+        processed_dir=tmp_path / "processed"
+    )
+
+def test_find_quadlet_files(quadlet_handler, tmp_path):
+    """Test discovery of quadlet and configuration files."""
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    for name in ["web.container", "data.volume", "app.network", "settings.json",
+                 "app.env", "README.md"]:
+        (source_dir / name).write_text("")
+    # Directories are never returned, even if the name matches
+    (source_dir / "nested.container").mkdir()
+
+    files = quadlet_handler.find_quadlet_files(source_dir)
+    names = [f.name for f in files]
+
+    assert sorted(names) == ["app.env", "app.network", "data.volume", "settings.json", "web.container"]
+    # Quadlet files come before configuration files
+    assert set(names[:3]) == {"web.container", "data.volume", "app.network"}
+
+def test_find_quadlet_files_missing_directory(quadlet_handler, tmp_path):
+    """Test that a missing directory yields no files."""
+    assert quadlet_handler.find_quadlet_files(tmp_path / "missing") == []
+
+def test_deploy_processed_file_skips_unchanged(quadlet_handler, tmp_path):
+    """Test that deploying identical content leaves the deployed file untouched."""
+    processed = tmp_path / "web.container"
+    processed.write_text("[Container]\nImage=nginx\n")
+
+    assert quadlet_handler.deploy_processed_file(processed, "container")
+    target = quadlet_handler.systemd_dir / "web.container"
+    assert target.read_text() == processed.read_text()
+
+    # Second deploy of the same content does not create a backup
+    assert quadlet_handler.deploy_processed_file(processed, "container")
+    assert not (quadlet_handler.systemd_dir / "web.container.bak").exists()
+
+    # Changed content is deployed and the previous version backed up
+    processed.write_text("[Container]\nImage=httpd\n")
+    assert quadlet_handler.deploy_processed_file(processed, "container")
+    assert target.read_text() == "[Container]\nImage=httpd\n"
+    assert (quadlet_handler.systemd_dir / "web.container.bak").exists()
+
+def test_deploy_processed_file_uses_stored_digest(tmp_path):
+    """Test that a recorded digest skips unchanged files and detects edits."""
+    from src.state.manager import StateManager
+
+    handler = QuadletHandler(
+        systemd_dir=tmp_path / "systemd",
+        processed_dir=tmp_path / "processed",
+        state_manager=StateManager(tmp_path / "state.db")
+    )
+    processed = tmp_path / "web.container"
+    processed.write_text("[Container]\nImage=nginx\n")
+    target = handler.systemd_dir / "web.container"
+
+    assert handler.deploy_processed_file(processed, "container")
+    assert handler.state_manager.get_file_digest(target)[0] == file_sha256(processed)
+
+    # Unchanged content is skipped without creating a backup
+    assert handler.deploy_processed_file(processed, "container")
+    assert not (handler.systemd_dir / "web.container.bak").exists()
+
+    processed.write_text("[Container]\nImage=httpd\n")
+    assert handler.deploy_processed_file(processed, "container")
+    assert target.read_text() == "[Container]\nImage=httpd\n"
+    assert handler.state_manager.get_file_digest(target)[0] == file_sha256(processed)
+
+def test_deploy_processed_file_requests_reload_on_change(tmp_path):
+    """Test that only a changed file marks the systemd daemon for reload."""
+    class FakeSystemdManager:
+        reload_requests = 0
+
+        def mark_reload_needed(self):
+            self.reload_requests += 1
+
+    handler = QuadletHandler(
+        systemd_dir=tmp_path / "systemd",
+        processed_dir=tmp_path / "processed",
+        systemd_manager=FakeSystemdManager()
+    )
+    processed = tmp_path / "web.container"
+    processed.write_text("[Container]\nImage=nginx\n")
+
+    assert handler.deploy_processed_file(processed, "container")
+    assert handler.deploy_processed_file(processed, "container")
+    assert handler.systemd_manager.reload_requests == 1